@@ -0,0 +1,174 @@
+import multiprocessing
+import os
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from discovery import DiscoveryStream, StaticFileSource
+from disk_cache import ParseCache, file_digest
+from universal_parser import UniversalOrderParser
+
+# Парсер та кеш конкретного процесу-воркера (створюються один раз при старті процесу)
+_worker_parser: Optional[UniversalOrderParser] = None
+_worker_cache: Optional[ParseCache] = None
+
+
+def _init_worker(use_cache: bool = True, parser_options: Optional[Dict] = None):
+    """Ініціалізація процесу-воркера: створюємо «теплий» парсер та з'єднання з кешем"""
+    global _worker_parser, _worker_cache
+    options = dict(parser_options or {})
+    options.setdefault('ocr_cache', use_cache)
+    _worker_parser = UniversalOrderParser(**options)
+    if use_cache:
+        try:
+            _worker_cache = ParseCache(_worker_parser.fingerprint())
+        except Exception:
+            # Недоступний кеш не повинен зупиняти аналіз
+            _worker_cache = None
+
+
+def parse_with_cache(parser: UniversalOrderParser, cache: Optional[ParseCache], file_path: str) -> Dict:
+    """Парсинг документа з використанням кешу за хешем вмісту файлу"""
+    try:
+        file_hash = file_digest(file_path)
+    except OSError:
+        # Помилку читання файлу повідомить сам парсер
+        return parser.parse_document(file_path)
+
+    if cache is not None:
+        cached = cache.get(file_hash)
+        if cached is not None:
+            # Той самий вміст міг бути скопійований в іншу папку під іншою назвою
+            cached['file_name'] = os.path.basename(file_path)
+            cached['file_path'] = os.path.abspath(file_path)
+            return cached
+
+    result = parser.parse_document(file_path)
+    result['file_hash'] = file_hash
+    if cache is not None and 'error' not in result:
+        cache.put(file_hash, result)
+    return result
+
+
+def _parse_in_worker(index: int, file_path: str):
+    """Парсинг одного документа у процесі-воркері"""
+    return index, parse_with_cache(_worker_parser, _worker_cache, file_path)
+
+
+def default_worker_count(total_files: int) -> int:
+    """Автоматичний підбір кількості процесів: всі ядра, крім одного для GUI"""
+    cpu_count = os.cpu_count() or 1
+    return max(1, min(cpu_count - 1 or 1, total_files))
+
+
+def clear_parse_cache():
+    """Очищення кешу результатів (перебудова кешу при наступному аналізі)"""
+    cache = ParseCache(UniversalOrderParser().fingerprint())
+    try:
+        cache.clear()
+    finally:
+        cache.close()
+
+
+class BatchEngine:
+    """Паралельна обробка пакета документів пулом процесів"""
+
+    def __init__(self, max_workers: Optional[int] = None,
+                 use_cache: bool = True, rebuild_cache: bool = False,
+                 parser_options: Optional[Dict] = None):
+        self.max_workers = max_workers
+        # Параметри UniversalOrderParser для процесів-воркерів (наприклад, pdf_workers)
+        self.parser_options = parser_options or {}
+        self.use_cache = use_cache
+        self.rebuild_cache = rebuild_cache
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._paths: Dict[int, str] = {}
+        self._cancelled = False
+
+    def run(self, files: Union[List[str], DiscoveryStream],
+            on_result: Callable[[int, str, Dict], None],
+            should_stop: Callable[[], bool] = lambda: False) -> int:
+        """Обробка файлів; on_result викликається для кожного документа по мірі готовності.
+
+        files — готовий список або DiscoveryStream, з якого шляхи беруться по мірі
+        знаходження. Результати приходять у порядку завершення, тому разом з ними
+        передається індекс файлу в порядку знаходження. Повертає кількість
+        оброблених документів.
+        """
+        source = files if isinstance(files, DiscoveryStream) else StaticFileSource(files)
+        if isinstance(files, list) and not files:
+            return 0
+
+        self._cancelled = False
+        self._paths = {}
+        total_hint = len(files) if isinstance(files, list) else (os.cpu_count() or 1)
+        workers = self.max_workers or default_worker_count(total_hint)
+        # Обмежуємо кількість задач «у польоті», щоб зупинка не чекала на весь пакет
+        max_in_flight = workers * 2
+        processed = 0
+
+        if self.use_cache and self.rebuild_cache:
+            clear_parse_cache()
+
+        # Пул OCR кожного воркера розрахований на всі ядра (один великий скан
+        # розпізнається смугами паралельно), а спільний семафор не дає всім
+        # воркерам разом запустити більше tesseract, ніж є ядер
+        parser_options = dict(self.parser_options)
+        parser_options.setdefault('ocr_slots', multiprocessing.BoundedSemaphore(os.cpu_count() or 1))
+
+        source.start()
+        self._executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                             initargs=(self.use_cache, parser_options))
+        try:
+            pending = set()
+            futures_index = {}
+            next_index = 0
+
+            while not self._stop_requested(should_stop):
+                room = max_in_flight - len(pending)
+                # Якщо задач немає, чекаємо на наступний знайдений файл
+                for file_path in source.take(room, timeout=0 if pending else 0.2):
+                    future = self._executor.submit(_parse_in_worker, next_index, file_path)
+                    futures_index[future] = next_index
+                    self._paths[next_index] = file_path
+                    pending.add(future)
+                    next_index += 1
+
+                if not pending:
+                    if source.exhausted:
+                        break
+                    continue
+
+                done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, result = self._collect(future, futures_index)
+                    processed += 1
+                    on_result(index, self._paths.pop(index), result)
+        finally:
+            source.stop()
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+        return processed
+
+    def cancel(self):
+        """Скасування задач, що ще не розпочались (безпечно викликати з іншого потоку)"""
+        self._cancelled = True
+
+    def _collect(self, future, futures_index: Dict) -> Tuple[int, Dict]:
+        """Отримання результату задачі; збій процесу перетворюється на запис з помилкою"""
+        index = futures_index.pop(future)
+        try:
+            return future.result()
+        except Exception as e:
+            return index, {
+                'file_name': os.path.basename(self._paths[index]),
+                'file_path': os.path.abspath(self._paths[index]),
+                'error': f"Збій процесу обробки: {str(e)}",
+                'personnel': [],
+                'advanced_data': {},
+                'processing_time': datetime.now().isoformat()
+            }
+
+    def _stop_requested(self, should_stop: Callable[[], bool]) -> bool:
+        return self._cancelled or should_stop()
@@ -0,0 +1,65 @@
+"""Бенчмарк спільного контексту документа (DocumentContext).
+
+Порівнює попередній конвеєр, де очищення тексту робило два повні проходи
+регулярними виразами, а тип, номер і дату наказу окремо обчислювали обидва
+парсери, з одним контекстом на документ.
+
+    python benchmarks/bench_analysis_context.py
+"""
+import re
+import timeit
+
+from sample_orders import make_order
+from keyword_matcher import KeywordMatcher
+from universal_parser import DocumentContext, UniversalOrderParser
+
+
+def legacy_pipeline(raw_text: str, parser: UniversalOrderParser):
+    """Попередня послідовність проходів по тексту"""
+    # Очищення: два повні проходи
+    text = re.sub(r'\s+', ' ', raw_text)
+    text = re.sub(r'[^\w\sА-ЯІЇЄа-яіїєґҐ.,;:!?()\-—№\'"]', ' ', text).strip()
+
+    # UniversalOrderParser: тип, номер (до трьох шаблонів), дата
+    parser.keywords.first(text, 'order_type')
+    for pattern in (r'№\s*(\d+)', r'Наказ.*?№\s*(\d+)', r'НАКАЗ.*?№\s*(\d+)'):
+        if re.search(pattern, text, re.IGNORECASE):
+            break
+    re.search(r'\b(\d{1,2}\.\d{1,2}\.\d{4})\b', text)
+
+    # AdvancedOrderParser: ті самі реквізити ще раз, іншими шаблонами
+    parser.keywords.first(text, 'order_type')
+    for pattern in (r'№\s*(\d+)', r'Наказ.*?№\s*(\d+)'):
+        if re.search(pattern, text):
+            break
+    re.search(r'\d{1,2}\.\d{1,2}\.\d{4}', text)
+    re.search(r'військової частини\s*([А-Я]\d+)', text, re.IGNORECASE)
+    'В И Т Я Г І З Н А К А З У' in text or 'ВИТЯГ ІЗ НАКАЗУ' in text
+
+
+def context_pipeline(raw_text: str, keywords: KeywordMatcher):
+    """Один контекст: одне очищення, кожен реквізит обчислюється один раз"""
+    context = DocumentContext.from_raw(raw_text, keywords)
+    # Обидва парсери звертаються до тих самих (вже обчислених) значень
+    for _ in range(2):
+        context.order_type
+        context.order_number
+        context.date
+        context.military_unit
+
+
+def main():
+    parser = UniversalOrderParser()
+    print("Проходи по тексту: було 2 очищення + 2×(тип, номер, дата) + частина; "
+          "стало 1 очищення + 1×(тип, номер, дата, частина)")
+    print(f"{'сторінок':>9} {'було, мс':>10} {'стало, мс':>10} {'прискорення':>12}")
+    for pages in (1, 10, 50, 300):
+        raw_text = make_order(pages)
+        repeat = max(3, 300 // pages)
+        legacy = min(timeit.repeat(lambda: legacy_pipeline(raw_text, parser), number=1, repeat=repeat))
+        current = min(timeit.repeat(lambda: context_pipeline(raw_text, parser.keywords), number=1, repeat=repeat))
+        print(f"{pages:>9} {legacy * 1000:>10.2f} {current * 1000:>10.2f} {legacy / current:>11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Бенчмарк читання DOCX.
+
+Порівнює попереднє читання через об'єктну модель python-docx (лише абзаци,
+таблиці втрачались) з потоковим розбором word/document.xml у docx_reader.
+Тестові документи генеруються без python-docx: наказ з пунктами та
+таблицею виплат.
+
+    python benchmarks/bench_docx.py
+"""
+import os
+import tempfile
+import timeit
+import zipfile
+from xml.sax.saxutils import escape
+
+from sample_orders import POINTS_PER_PAGE, make_point
+from docx_reader import read_docx_text
+
+try:
+    from docx import Document
+    PYTHON_DOCX_AVAILABLE = True
+except ImportError:
+    PYTHON_DOCX_AVAILABLE = False
+
+CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+
+def _paragraph(text: str) -> str:
+    return f'<w:p><w:r><w:t xml:space="preserve">{escape(text)}</w:t></w:r></w:p>'
+
+
+def _table(rows) -> str:
+    cells = ''.join('<w:tr>' + ''.join(f'<w:tc>{_paragraph(value)}</w:tc>' for value in row) + '</w:tr>'
+                    for row in rows)
+    return f'<w:tbl>{cells}</w:tbl>'
+
+
+def make_docx(path: str, pages: int):
+    """DOCX-наказ: пункти абзацами, по таблиці виплат на кожну сторінку"""
+    body = [_paragraph("НАКАЗ командира військової частини А1234 (по особовому складу)"),
+            _paragraph("м. Київ № 125 12.05.2024")]
+    for page in range(pages):
+        for number in range(page * POINTS_PER_PAGE + 1, (page + 1) * POINTS_PER_PAGE + 1):
+            body.append(_paragraph(make_point(number).strip()))
+        body.append(_table([(f"{row}", f"Петренко Іван Іванович {row}", f"{5000 + row} грн")
+                            for row in range(page * 10, page * 10 + 10)]))
+    document = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+                f'<w:body>{"".join(body)}</w:body></w:document>')
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', CONTENT_TYPES)
+        archive.writestr('_rels/.rels', RELS)
+        archive.writestr('word/document.xml', document)
+
+
+def legacy_read(path: str) -> str:
+    """Попереднє читання: повна модель документа, лише абзаци"""
+    doc = Document(path)
+    return '\n'.join([paragraph.text for paragraph in doc.paragraphs])
+
+
+def main():
+    if not PYTHON_DOCX_AVAILABLE:
+        print("python-docx не встановлено — вимірюється лише потоковий читач")
+    print(f"{'сторінок':>9} {'python-docx, мс':>16} {'потоковий, мс':>14} {'символів (було/стало)':>24}")
+    with tempfile.TemporaryDirectory() as folder:
+        for pages in (1, 10, 100, 500):
+            path = os.path.join(folder, f'order_{pages}.docx')
+            make_docx(path, pages)
+            repeat = max(3, 100 // pages)
+            current = min(timeit.repeat(lambda: read_docx_text(path), number=1, repeat=repeat))
+            current_chars = len(read_docx_text(path))
+            if PYTHON_DOCX_AVAILABLE:
+                legacy = min(timeit.repeat(lambda: legacy_read(path), number=1, repeat=repeat))
+                legacy_cell = f"{legacy * 1000:16.1f}"
+                legacy_chars = len(legacy_read(path))
+            else:
+                legacy_cell = f"{'—':>16}"
+                legacy_chars = '—'
+            print(f"{pages:>9} {legacy_cell} {current * 1000:14.1f} {f'{legacy_chars}/{current_chars}':>24}")
+
+
+if __name__ == '__main__':
+    main()
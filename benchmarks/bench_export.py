@@ -0,0 +1,105 @@
+"""Бенчмарк експорту результатів.
+
+Генерує результати аналізу заданого обсягу (документи × особи) і вимірює
+час та розмір файлу для кожного формату: обидва мають зростати лінійно.
+
+    python benchmarks/bench_export.py
+
+json-c — компактний JSON, json-cs — компактний без raw_text та advanced_data.
+"""
+import os
+import tempfile
+import time
+
+from sample_orders import ACTIONS, NAMES, RANKS, SURNAMES
+from modern_exporter import ModernExporter
+
+PERSONNEL_PER_ORDER = 20
+
+# (назва у таблиці, формат, розширення, параметри export_data)
+FORMATS = [
+    ('html', 'html', '.html', {}),
+    ('json', 'json', '.json', {}),
+    ('json-c', 'json', '.json', {'compact': True}),
+    ('json-cs', 'json', '.json', {'compact': True, 'slim': True}),
+    ('ndjson', 'ndjson', '.ndjson', {}),
+    ('excel', 'excel', '.xlsx', {}),
+    ('sqlite', 'sqlite', '.sqlite', {}),
+    ('parquet', 'parquet', '.parquet', {}),
+]
+
+try:
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+
+def make_results(documents: int):
+    """Результати parse_document для бенчмарку (по PERSONNEL_PER_ORDER осіб на документ)"""
+    results = []
+    for index in range(documents):
+        personnel = [{
+            'action': ACTIONS[person % len(ACTIONS)],
+            'full_name': f"{SURNAMES[person % len(SURNAMES)]} {NAMES[person % len(NAMES)]}",
+            'rank': RANKS[person % len(RANKS)],
+            'position': 'командир відділення',
+            'original_text': 'Призначити на посаду командира відділення ' * 4
+        } for person in range(PERSONNEL_PER_ORDER)]
+        changes = [{'type': person['action'], 'point_number': str(number + 1),
+                    'personnel_data': [person], 'content': person['original_text']}
+                   for number, person in enumerate(personnel)]
+        results.append({
+            'file_name': f'order_{index}.docx',
+            'file_path': f'/orders/order_{index}.docx',
+            'file_type': '.docx',
+            'file_hash': f'{index:064x}',
+            'type': 'personnel',
+            'number': str(index),
+            'date': '12.05.2024',
+            'personnel': personnel,
+            'raw_text': 'НАКАЗ командира військової частини А1234 ' * 25,
+            'advanced_data': {
+                'military_unit': 'А1234',
+                'personnel_changes': changes,
+                'financial_operations': [{'type': 'посадовий оклад', 'description': 'оклад', 'amount': '5000 грн'}],
+                'document_operations': [{'type': 'відпустка', 'description': 'щорічна', 'duration': '15 діб'}]
+            }
+        })
+    return results
+
+
+def output_size(path: str) -> int:
+    """Розмір файлу або (для CSV і Parquet) папки з таблицями"""
+    folder = os.path.splitext(path)[0]
+    if not os.path.exists(path) and os.path.isdir(folder):
+        return sum(os.path.getsize(os.path.join(folder, name)) for name in os.listdir(folder))
+    return os.path.getsize(path)
+
+
+def main():
+    exporter = ModernExporter()
+    print(f"{'формат':>8} {'документів':>11} {'осіб':>8} {'час, с':>8} {'розмір, МБ':>11}")
+    with tempfile.TemporaryDirectory() as folder:
+        for documents in (500, 5000, 20000):
+            results = make_results(documents)
+            for label, format_type, suffix, options in FORMATS:
+                if format_type == 'parquet' and not PARQUET_AVAILABLE:
+                    continue
+                path = os.path.join(folder, f'report_{documents}_{label}{suffix}')
+                started = time.perf_counter()
+                exporter.export_data(results, path, format_type, **options)
+                elapsed = time.perf_counter() - started
+                size = output_size(path) / 1024 / 1024
+                print(f"{label:>8} {documents:>11} {documents * PERSONNEL_PER_ORDER:>8} "
+                      f"{elapsed:8.2f} {size:11.1f}")
+
+                if format_type == 'parquet':
+                    # Завантаження таблиці персоналу аналітиком (pandas через pyarrow)
+                    started = time.perf_counter()
+                    pq.read_table(os.path.join(os.path.splitext(path)[0], 'personnel.parquet'))
+                    print(f"{'':>8} завантаження personnel.parquet: {time.perf_counter() - started:.3f} с")
+
+
+if __name__ == '__main__':
+    main()
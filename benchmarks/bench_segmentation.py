@@ -0,0 +1,121 @@
+"""Бенчмарк розбиття наказу на пункти: від 1 до 300 сторінок.
+
+Порівнює попередній re.findall з лінивим «.*?» та lookahead на кожному
+символі з однопрохідним segment_points. Також показує кількість знайдених
+пунктів: попередній шаблон вважав початком пункту кожну дату «12.05.2024».
+
+Перед вимірюванням перевіряються контрольні випадки SEGMENTATION_CASES та
+POSITION_CASES (завершується з кодом 1, якщо розбиття чи посада не
+збігаються з очікуваними).
+
+Друга таблиця — екстрактори фінансових, документних і структурних операцій:
+раніше їхні ліниві шаблони проходили весь текст від кожного збігу ключового
+слова (надлінійний час), тепер пошук обмежений межами пункту. Старий варіант
+вимірюється лише на малих обсягах — на більших він працює хвилини.
+
+    python benchmarks/bench_segmentation.py
+"""
+import re
+import sys
+import timeit
+
+from sample_orders import POINTS_PER_PAGE, make_order
+from text_segmenter import EXTRACT_STOP_WORDS, PositionIndex, numbered_points, segment_points
+from universal_parser import AdvancedOrderParser, clean_text
+
+LEGACY_POINTS_RE = re.compile(r'(\d+\.)\s*(.*?)(?=\d+\.|Командир|Підстава|$)', re.DOTALL)
+
+
+def legacy_segmentation(text: str):
+    return LEGACY_POINTS_RE.findall(text)
+
+
+def current_segmentation(text: str):
+    return numbered_points(segment_points(text, EXTRACT_STOP_WORDS))
+
+
+# (текст, очікувані (номер, вміст) пунктів)
+SEGMENTATION_CASES = [
+    # Дати та номери документів не є початком пункту
+    ("1. Наказ від 12.05.2024 № 125. Виконати 2. Петров",
+     [('1', 'Наказ від 12.05.2024 № 125. Виконати'), ('2', 'Петров')]),
+    # Зведений наказ: у кожному розділі нумерація починається з «1.»
+    ("1. Іванов І. 2. Петров П. 1. Сидоров С. 2. Коваль О. Підстава: рапорт",
+     [('1', 'Іванов І.'), ('2', 'Петров П.'), ('1', 'Сидоров С.'), ('2', 'Коваль О.')]),
+]
+
+
+# (текст, ПІБ, очікувана посада)
+POSITION_CASES = [
+    # Кілька зворотів «на посаду» в одному реченні без крапки між ними
+    ("Солдат Іванов Іван Іванович на посаду водія, Солдат Петров Петро Петрович на посаду стрільця.",
+     "Петров Петро Петрович", "стрільця"),
+    ("Солдат Іванов Іван Іванович на посаду водія. Солдат Петров Петро Петрович на посаду стрільця.",
+     "Іванов Іван Іванович", "водія"),
+]
+
+
+def check_segmentation() -> bool:
+    passed = True
+    for text, expected in SEGMENTATION_CASES:
+        actual = [(span.number, span.content(text)) for span in numbered_points(segment_points(text))]
+        if actual != expected:
+            print(f"❌ {text!r}: очікувалось {expected}, отримано {actual}")
+            passed = False
+    for text, name, expected in POSITION_CASES:
+        actual = PositionIndex(text).position_after(text.index(name) + len(name))
+        if actual != expected:
+            print(f"❌ {name}: очікувалась посада {expected!r}, отримано {actual!r}")
+            passed = False
+    return passed
+
+
+EXTRACTOR_RES = (AdvancedOrderParser._PAYMENT_RES + list(AdvancedOrderParser._DOCUMENT_RES.values())
+                 + AdvancedOrderParser._STRUCTURE_RES)
+
+# Найбільший обсяг, на якому ще вимірюється старий варіант екстракторів
+LEGACY_EXTRACTORS_MAX_PAGES = 3
+
+
+def legacy_extractors(text: str):
+    for pattern in EXTRACTOR_RES:
+        list(pattern.finditer(text))
+
+
+def current_extractors(text: str, spans):
+    for pattern in EXTRACTOR_RES:
+        for span in spans:
+            list(pattern.finditer(text, span.start, span.end))
+
+
+def main() -> int:
+    if not check_segmentation():
+        return 1
+
+    print(f"{'сторінок':>9} {'пунктів':>8} {'було пунктів':>13} {'стало пунктів':>14} "
+          f"{'було, мс':>10} {'стало, мс':>10} {'прискорення':>12}")
+    for pages in (1, 10, 50, 100, 300):
+        text = clean_text(make_order(pages))
+        repeat = max(3, 100 // pages)
+        legacy = min(timeit.repeat(lambda: legacy_segmentation(text), number=1, repeat=repeat))
+        current = min(timeit.repeat(lambda: current_segmentation(text), number=1, repeat=repeat))
+        print(f"{pages:>9} {pages * POINTS_PER_PAGE:>8} {len(legacy_segmentation(text)):>13} "
+              f"{len(current_segmentation(text)):>14} {legacy * 1000:>10.2f} {current * 1000:>10.2f} "
+              f"{legacy / current:>11.1f}x")
+
+    print()
+    print(f"{'сторінок':>9} {'екстрактори було, мс':>21} {'стало, мс':>10}")
+    for pages in (1, 2, 3, 10, 50, 100, 300):
+        text = clean_text(make_order(pages))
+        spans = segment_points(text)
+        current = min(timeit.repeat(lambda: current_extractors(text, spans), number=1, repeat=3))
+        if pages <= LEGACY_EXTRACTORS_MAX_PAGES:
+            legacy = f"{min(timeit.repeat(lambda: legacy_extractors(text), number=1, repeat=3)) * 1000:.2f}"
+        else:
+            legacy = '—'
+        print(f"{pages:>9} {legacy:>21} {current * 1000:>10.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""Бенчмарк холодного запуску програми.
+
+Кожне вимірювання — у новому процесі Python:
+  * час імпорту main.py та перелік важких бібліотек, завантажених при цьому
+    (їх бути не повинно: бібліотеки форматів та експорту завантажуються при першому
+    використанні);
+  * час від запуску до появи вікна (якщо є графічний дисплей).
+
+Завершується з кодом 1, якщо перевищено STARTUP_BUDGET_SECONDS з main.py
+або під час запуску завантажено важку бібліотеку.
+
+    python benchmarks/bench_startup.py
+"""
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Бібліотеки, які не мають завантажуватись до першого використання
+HEAVY_MODULES = ('pandas', 'numpy', 'openpyxl', 'PyPDF2', 'docx', 'PIL', 'pytesseract', 'pdf2image')
+
+RUNS = 5
+
+IMPORT_PROBE = f"""
+import json, sys, time
+started = time.perf_counter()
+import main
+elapsed = time.perf_counter() - started
+heavy = [name for name in {HEAVY_MODULES!r} if name in sys.modules]
+print(json.dumps({{'seconds': elapsed, 'heavy': heavy, 'budget': main.STARTUP_BUDGET_SECONDS}}))
+"""
+
+WINDOW_PROBE = """
+import json
+import main
+root = main.tk.Tk()
+app = main.ModernOrderAnalyzerApp(root)
+root.update()
+print(json.dumps({'seconds': app.startup_seconds}))
+root.destroy()
+"""
+
+
+def probe(code: str) -> dict:
+    output = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True,
+                            text=True, encoding='utf-8', check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def has_display() -> bool:
+    return sys.platform == 'win32' or bool(os.environ.get('DISPLAY'))
+
+
+def main() -> int:
+    imports = [probe(IMPORT_PROBE) for _ in range(RUNS)]
+    budget = imports[0]['budget']
+    import_seconds = min(run['seconds'] for run in imports)
+    heavy = imports[0]['heavy']
+    print(f"Імпорт main.py: {import_seconds * 1000:.0f} мс (найкраще з {RUNS})")
+    print(f"Важкі бібліотеки під час запуску: {', '.join(heavy) if heavy else 'немає'}")
+
+    startup_seconds = import_seconds
+    if has_display():
+        startup_seconds = min(probe(WINDOW_PROBE)['seconds'] for _ in range(RUNS))
+        print(f"До появи вікна: {startup_seconds * 1000:.0f} мс (найкраще з {RUNS})")
+    else:
+        print("Графічний дисплей недоступний — час до появи вікна не вимірюється")
+
+    print(f"Бюджет: {budget * 1000:.0f} мс")
+    if heavy or startup_seconds > budget:
+        print("❌ Бюджет запуску порушено")
+        return 1
+    print("✅ Запуск у межах бюджету")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
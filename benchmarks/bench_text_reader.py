@@ -0,0 +1,68 @@
+"""Бенчмарк читання текстових файлів з визначенням кодування.
+
+Спершу перевіряються контрольні випадки ENCODING_CASES (завершується з
+кодом 1, якщо кодування визначено неправильно), далі вимірюється час
+read_text_file на наказах різного обсягу в кожному кодуванні.
+
+    python benchmarks/bench_text_reader.py
+"""
+import os
+import sys
+import tempfile
+import timeit
+
+from sample_orders import make_order
+from text_reader import decode_bytes, read_text_file
+
+
+
+def order_text(pages: int) -> str:
+    """Наказ лише з символів, що є і в cp1251, і в KOI8-U (без «№» та «—»)"""
+    return make_order(pages).replace('№ ', '').replace('—', '-')
+
+
+# (текст, кодування файлу)
+ENCODING_CASES = [
+    (order_text(1), 'cp1251'),
+    (order_text(1), 'koi8-u'),
+    (order_text(1), 'utf-8'),
+    # Витяги, набрані великими літерами
+    ("В И Т Я Г І З Н А К А З У\nКОМАНДИРА ВІЙСЬКОВОЇ ЧАСТИНИ А1234\n"
+     "ПРИЗНАЧИТИ НА ПОСАДУ ВОДІЯ", 'cp1251'),
+    ("В И Т Я Г І З Н А К А З У\nКОМАНДИРА ВІЙСЬКОВОЇ ЧАСТИНИ А1234\n"
+     "ПРИЗНАЧИТИ НА ПОСАДУ ВОДІЯ", 'koi8-u'),
+    ("ПІБ: ІВАНОВ", 'cp1251'),
+    # Довгий ASCII-заголовок перед кирилицею
+    ("1234567890 Lorem ipsum\n" * 4000 + order_text(1), 'koi8-u'),
+]
+
+
+def check_encodings() -> bool:
+    passed = True
+    for text, encoding in ENCODING_CASES:
+        decoded, detected = decode_bytes(text.encode(encoding))
+        if decoded != text:
+            print(f"❌ {text[:30]!r} у {encoding}: визначено {detected}")
+            passed = False
+    return passed
+
+
+def main() -> int:
+    if not check_encodings():
+        return 1
+
+    print(f"{'сторінок':>9} {'кодування':>10} {'розмір, КБ':>11} {'час, мс':>9}")
+    with tempfile.TemporaryDirectory() as folder:
+        for pages in (1, 10, 100, 1000):
+            text = order_text(pages)
+            for encoding in ('utf-8', 'cp1251', 'koi8-u'):
+                path = os.path.join(folder, f'order_{pages}_{encoding}.txt')
+                with open(path, 'w', encoding=encoding) as f:
+                    f.write(text)
+                seconds = min(timeit.repeat(lambda: read_text_file(path), number=1, repeat=5))
+                print(f"{pages:>9} {encoding:>10} {os.path.getsize(path) / 1024:>11.0f} {seconds * 1000:>9.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
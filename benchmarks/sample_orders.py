@@ -0,0 +1,34 @@
+"""Генерація синтетичних наказів для бенчмарків"""
+import os
+import sys
+
+# Бенчмарки запускаються з папки benchmarks/, модулі програми лежать у корені
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+RANKS = ['солдат', 'старший сержант', 'молодший лейтенант', 'капітан', 'майор']
+ACTIONS = ['призначити', 'звільнити', 'відрядити', 'перевести']
+SURNAMES = ['Петренко', 'Коваленко', 'Шевчук', 'Бондар', 'Ткаченко', 'Мельник']
+NAMES = ['Іван', 'Петро', 'Олег', 'Андрій', 'Сергій']
+PATRONYMICS = ['Іванович', 'Петрович', 'Олегович', 'Андрійович']
+
+# Приблизна кількість пунктів на сторінці наказу
+POINTS_PER_PAGE = 12
+
+
+def make_point(number: int) -> str:
+    rank = RANKS[number % len(RANKS)].capitalize()
+    person = (f"{SURNAMES[number % len(SURNAMES)]} {NAMES[number % len(NAMES)]} "
+              f"{PATRONYMICS[number % len(PATRONYMICS)]}")
+    action = ACTIONS[number % len(ACTIONS)]
+    return (f"{number}. {rank} {person}, 0{number % 9 + 1}.0{number % 9 + 1}.1990 р.н., "
+            f"{action} на посаду командира відділення з {number % 28 + 1}.05.2024, "
+            f"посадовий оклад — {5000 + number} грн. Виплачувати надбавку {number % 50 + 10} %.\n")
+
+
+def make_order(pages: int = 1) -> str:
+    """Наказ по особовому складу заданого обсягу (у сторінках)"""
+    header = ("НАКАЗ командира військової частини А1234 (по особовому складу)\n"
+              "м. Київ № 125 12.05.2024\n")
+    points = ''.join(make_point(i + 1) for i in range(pages * POINTS_PER_PAGE))
+    footer = "Підстава: рапорти військовослужбовців.\nКомандир військової частини А1234\n"
+    return header + points + footer
@@ -1,23 +1,32 @@
 @echo off
-echo 🚀 Збірка програми в EXE...
+rem Використання: build.bat          — один EXE-файл (--onefile)
+rem               build.bat onedir   — папка з програмою: без розпакування при кожному запуску, стартує швидше
+set BUILD_MODE=--onefile
+if /I "%~1"=="onedir" set BUILD_MODE=--onedir
+
+echo 🚀 Збірка програми в EXE (%BUILD_MODE%)...
 
 pyinstaller --name="АналізаторНаказівЗСУ" ^
             --windowed ^
-            --onefile ^
+            %BUILD_MODE% ^
+            --noconfirm ^
             --icon=icon.ico ^
             --add-data="patterns.json;." ^
             --hidden-import=typing ^
             --hidden-import=pathlib ^
             --hidden-import=threading ^
             --hidden-import=webbrowser ^
-            --hidden-import=docx ^
             --hidden-import=PyPDF2 ^
-            --hidden-import=pandas ^
             --hidden-import=openpyxl ^
             --hidden-import=pytesseract ^
             --hidden-import=PIL ^
+            --hidden-import=pdf2image ^
             main.py
 
 echo ✅ Збірка завершена!
-echo 📁 EXE файл знаходиться в папці dist/
+if /I "%BUILD_MODE%"=="--onedir" (
+    echo 📁 Програма знаходиться в папці dist/АналізаторНаказівЗСУ/
+) else (
+    echo 📁 EXE файл знаходиться в папці dist/
+)
 pause
\ No newline at end of file
@@ -0,0 +1,228 @@
+"""Консольний (headless) режим пакетного аналізу наказів без графічного інтерфейсу.
+
+Приклади:
+    python cli.py /srv/orders > results.ndjson
+    python cli.py "/srv/orders/**/*.pdf" -o results.ndjson
+    python cli.py /srv/orders --format excel -o report.xlsx
+    python cli.py /srv/orders --format sqlite -o orders.sqlite   (дописує нові та змінені документи)
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from typing import Callable, Dict, IO, Iterator, List, Optional
+
+from batch_engine import BatchEngine
+from discovery import DiscoveryStream, iter_document_files
+from folder_watcher import FolderWatcher
+from modern_exporter import ModernExporter, strip_heavy_fields
+from pdf_reader import DEFAULT_MAX_PAGES
+from results_store import ResultsStore
+from universal_parser import SUPPORTED_EXTENSIONS
+
+# Формати, які підтримує ModernExporter.export_data (ndjson пишеться потоково самим CLI)
+EXPORT_FORMATS = ('html', 'json', 'csv', 'excel', 'sqlite', 'parquet')
+
+
+def iter_input_files(inputs: List[str], onerror: Optional[Callable[[OSError], None]] = None) -> Iterator[str]:
+    """Розгортання вхідних папок (рекурсивно) та glob-шаблонів у підтримувані файли"""
+    seen = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            candidates = iter_document_files(item, onerror=onerror)
+        else:
+            candidates = (path for path in sorted(glob.glob(item, recursive=True))
+                          if os.path.isfile(path) and path.lower().endswith(SUPPORTED_EXTENSIONS))
+
+        for path in candidates:
+            key = os.path.abspath(path)
+            if key not in seen:
+                seen.add(key)
+                yield path
+
+
+def collect_files(inputs: List[str]) -> List[str]:
+    """Повний список вхідних файлів"""
+    return list(iter_input_files(inputs))
+
+
+def write_ndjson_record(stream: IO[str], record: Dict, slim: bool = False):
+    """Запис одного документа як окремого рядка JSON з негайним скиданням буфера"""
+    if slim:
+        record = strip_heavy_fields(record)
+    stream.write(json.dumps(record, ensure_ascii=False, separators=(',', ':'), default=str))
+    stream.write('\n')
+    stream.flush()
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    arg_parser = argparse.ArgumentParser(
+        description="Пакетний аналіз наказів ЗСУ без графічного інтерфейсу")
+    arg_parser.add_argument('inputs', nargs='+',
+                            help="папки або glob-шаблони (наприклад, \"archive/**/*.pdf\")")
+    arg_parser.add_argument('-o', '--output',
+                            help="файл результатів (для ndjson за замовчуванням stdout)")
+    arg_parser.add_argument('-f', '--format', default='ndjson',
+                            choices=('ndjson',) + EXPORT_FORMATS,
+                            help="формат результатів (за замовчуванням ndjson)")
+    arg_parser.add_argument('--compact', action='store_true',
+                            help="JSON без відступів (менший файл, швидший запис)")
+    arg_parser.add_argument('--slim', action='store_true',
+                            help="не виводити raw_text та advanced_data (json, ndjson)")
+    arg_parser.add_argument('-j', '--workers', type=int, default=None,
+                            help="кількість процесів (за замовчуванням автоматично)")
+    arg_parser.add_argument('--pdf-workers', type=int, default=1,
+                            help="процесів на читання сторінок одного великого PDF")
+    arg_parser.add_argument('--pdf-max-pages', type=int, default=DEFAULT_MAX_PAGES,
+                            help="максимум сторінок PDF на документ")
+    arg_parser.add_argument('--no-pdf-ocr', action='store_true',
+                            help="не розпізнавати сторінки PDF без текстового шару")
+    arg_parser.add_argument('--ocr-workers', type=int, default=None,
+                            help="процесів OCR на кожен процес розбору (за замовчуванням автоматично)")
+    arg_parser.add_argument('--no-cache', action='store_true',
+                            help="не використовувати кеш результатів")
+    arg_parser.add_argument('--rebuild-cache', action='store_true',
+                            help="очистити кеш і розібрати всі файли заново")
+    arg_parser.add_argument('-w', '--watch', type=float, metavar='SECONDS', default=None,
+                            help="після аналізу стежити за змінами з указаним інтервалом")
+    arg_parser.add_argument('-q', '--quiet', action='store_true',
+                            help="не виводити прогрес у stderr")
+    return arg_parser
+
+
+def parser_options(args: argparse.Namespace) -> Dict:
+    options = {'pdf_workers': args.pdf_workers, 'pdf_max_pages': args.pdf_max_pages,
+               'pdf_ocr': not args.no_pdf_ocr}
+    if args.ocr_workers:
+        options['ocr_workers'] = args.ocr_workers
+    return options
+
+
+def run(args: argparse.Namespace) -> int:
+    if args.format != 'ndjson' and not args.output:
+        print(f"❌ Для формату {args.format} потрібно вказати --output", file=sys.stderr)
+        return 2
+
+    # Парсинг починається з першого знайденого файлу, поки пошук триває
+    discovery = DiscoveryStream(lambda: iter_input_files(args.inputs, onerror=discovery.skip))
+    failed = 0
+    # Для форматів ModernExporter результати збираються у вихідному порядку файлів
+    collected = ResultsStore() if args.format != 'ndjson' else None
+
+    stream = None
+    if args.format == 'ndjson':
+        stream = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+
+    processed = 0
+    incomplete = []
+    # Хеші розібраних файлів: початковий знімок для режиму стеження
+    known_hashes = {}
+
+    def on_result(index: int, file_path: str, order_data: Dict):
+        nonlocal failed, processed
+        processed += 1
+        if 'error' in order_data:
+            failed += 1
+        if order_data.get('file_hash'):
+            known_hashes[order_data['file_path']] = order_data['file_hash']
+
+        if stream is not None:
+            write_ndjson_record(stream, order_data, args.slim)
+        else:
+            collected.put(order_data, order_key=index)
+
+        if not args.quiet:
+            total_label = f"{discovery.discovered}" if discovery.finished else f"{discovery.discovered}+"
+            print(f"🔍 {processed}/{total_label}: {os.path.basename(file_path)}", file=sys.stderr)
+
+    engine = BatchEngine(max_workers=args.workers,
+                         use_cache=not args.no_cache,
+                         rebuild_cache=args.rebuild_cache,
+                         parser_options=parser_options(args))
+    try:
+        engine.run(discovery, on_result)
+        # Неповний перелік файлів — не успішний запуск, навіть якщо всі знайдені розібрано
+        incomplete = discovery.problems()
+        for problem in incomplete:
+            print(f"❌ {problem}", file=sys.stderr)
+
+        if discovery.discovered == 0 and not args.watch:
+            print("❌ Не знайдено підтримуваних файлів", file=sys.stderr)
+            return 2
+
+        if collected is not None:
+            export_collected(collected, args)
+
+        if not args.quiet:
+            print(f"✅ Оброблено: {processed}, з помилками: {failed}", file=sys.stderr)
+
+        if args.watch:
+            watch(args, stream, collected, known_hashes)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if stream is not None and stream is not sys.stdout:
+            stream.close()
+
+    return 1 if failed or incomplete else 0
+
+
+def export_collected(collected: ResultsStore, args: argparse.Namespace):
+    ModernExporter().export_data(collected.records, args.output, args.format,
+                                 compact=args.compact, slim=args.slim, stats=collected.stats)
+
+
+def watch(args: argparse.Namespace, stream: Optional[IO[str]],
+          collected: Optional[ResultsStore], known_hashes: Dict[str, str]):
+    """Режим стеження: періодично розбирає лише нові та змінені файли.
+
+    У режимі ndjson для змінених файлів виводяться нові записи, для видалених —
+    записи {"file_path": ..., "deleted": true}. Інші формати перезаписуються
+    після кожної зміни з оновленого на місці набору результатів.
+    """
+    watcher = FolderWatcher(lambda: collect_files(args.inputs))
+    watcher.seed(known_hashes)
+    engine = BatchEngine(max_workers=args.workers, use_cache=not args.no_cache,
+                         parser_options=parser_options(args))
+
+    def on_result(index: int, file_path: str, order_data: Dict):
+        if stream is not None:
+            write_ndjson_record(stream, order_data, args.slim)
+        else:
+            collected.put(order_data)
+        if not args.quiet:
+            print(f"👀 Оновлено: {os.path.basename(file_path)}", file=sys.stderr)
+
+    while True:
+        changed, removed = watcher.scan()
+
+        for file_path in removed:
+            if stream is not None:
+                write_ndjson_record(stream, {'file_path': file_path, 'deleted': True})
+            else:
+                collected.remove(file_path)
+            if not args.quiet:
+                print(f"🗑️ Видалено: {os.path.basename(file_path)}", file=sys.stderr)
+
+        if changed:
+            engine.run(changed, on_result)
+
+        if collected is not None and (changed or removed):
+            export_collected(collected, args)
+
+        time.sleep(args.watch)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Точка входу консольного режиму"""
+    # NDJSON завжди у UTF-8, незалежно від кодування консолі Windows
+    for stream in (sys.stdout, sys.stderr):
+        if hasattr(stream, 'reconfigure'):
+            stream.reconfigure(encoding='utf-8')
+    return run(build_arg_parser().parse_args(argv))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+import os
+import queue
+import threading
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from universal_parser import SUPPORTED_EXTENSIONS
+
+
+def iter_document_files(root: str, extensions: Tuple[str, ...] = SUPPORTED_EXTENSIONS,
+                        recursive: bool = True,
+                        onerror: Optional[Callable[[OSError], None]] = None) -> Iterator[str]:
+    """Рекурсивний обхід папки через os.scandir з видачею файлів по одному.
+
+    Тип запису береться з даних scandir (без окремого stat() на кожен файл),
+    підпапки обходяться у відсортованому порядку, щоб порядок файлів був
+    стабільним між запусками. Недоступні папки пропускаються; onerror, як
+    в os.walk, отримує помилку для кожної з них.
+    """
+    stack = [root]
+    while stack:
+        folder = stack.pop()
+        try:
+            with os.scandir(folder) as entries:
+                entries = sorted(entries, key=lambda e: e.name)
+        except OSError as e:
+            # Недоступна підпапка (права, зникла на NAS) не зупиняє обхід
+            if onerror is not None:
+                onerror(e)
+            continue
+
+        subfolders = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subfolders.append(entry.path)
+                elif entry.is_file() and entry.name.lower().endswith(extensions):
+                    yield entry.path
+            except OSError:
+                continue
+
+        if recursive:
+            # Зворотний порядок, щоб підпапки оброблялись за алфавітом
+            stack.extend(reversed(subfolders))
+
+
+class DiscoveryStream:
+    """Пошук файлів у фоновому потоці з подачею в обмежену чергу.
+
+    Парсинг може починатися з першого знайденого файлу, поки обхід папок
+    продовжується. Обмежена черга не дає пошуку випереджати обробку на
+    сотні тисяч шляхів. Після вичерпання потоку problems() повідомляє, чи
+    був перелік файлів неповним.
+    """
+
+    _DONE = object()
+
+    def __init__(self, produce: Callable[[], Iterable[str]], max_queued: int = 1024):
+        self._produce = produce
+        self._queue = queue.Queue(maxsize=max_queued)
+        self._stop = threading.Event()
+        self._thread = None
+        self._exhausted = False
+        self.discovered = 0
+        self.finished = False
+        self.error = None
+        self.skipped: List[OSError] = []
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def skip(self, error: OSError):
+        """Обробник onerror для iter_document_files: папку пропущено"""
+        self.skipped.append(error)
+
+    def problems(self) -> List[str]:
+        """Причини, з яких знайдено не всі файли (порожньо, якщо пошук повний)"""
+        problems = []
+        if self.error is not None:
+            problems.append(f"Пошук файлів перервано: {self.error}")
+        if self.skipped:
+            first = self.skipped[0]
+            problems.append(f"Пропущено недоступних папок: {len(self.skipped)} "
+                            f"({getattr(first, 'filename', None) or first})")
+        return problems
+
+    def _run(self):
+        try:
+            for path in self._produce():
+                # Рахується до подачі в чергу: оброблених не може стати більше, ніж знайдених
+                self.discovered += 1
+                if not self._put(path):
+                    return
+        except Exception as e:
+            self.error = e
+        finally:
+            self.finished = True
+            self._put(self._DONE)
+
+    def _put(self, item) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.2)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def take(self, limit: int, timeout: float = 0) -> List[str]:
+        """До limit знайдених шляхів; чекає не довше timeout, якщо черга порожня"""
+        items = []
+        while len(items) < limit and not self._exhausted:
+            try:
+                if items or not timeout:
+                    item = self._queue.get_nowait()
+                else:
+                    item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if item is self._DONE:
+                self._exhausted = True
+                break
+            items.append(item)
+        return items
+
+    @property
+    def exhausted(self) -> bool:
+        """Пошук завершено і всі знайдені шляхи вже видано"""
+        return self._exhausted
+
+
+class StaticFileSource:
+    """Готовий список файлів з тим самим інтерфейсом, що й DiscoveryStream"""
+
+    def __init__(self, files: List[str]):
+        self._files = files
+        self._next = 0
+        self.discovered = len(files)
+        self.finished = True
+        self.error = None
+        self.skipped: List[OSError] = []
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def problems(self) -> List[str]:
+        return []
+
+    def take(self, limit: int, timeout: float = 0) -> List[str]:
+        items = self._files[self._next:self._next + limit]
+        self._next += len(items)
+        return items
+
+    @property
+    def exhausted(self) -> bool:
+        return self._next >= len(self._files)
@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from typing import Dict, Optional
+
+# Назва папки з даними програми у профілі користувача
+APP_DIR_NAME = 'OrderAnalyzerZSU'
+
+
+def user_data_dir() -> str:
+    """Папка для даних програми у профілі користувача (кеші тощо)"""
+    base = os.environ.get('LOCALAPPDATA') or os.environ.get('XDG_CACHE_HOME')
+    if not base:
+        base = os.path.join(os.path.expanduser('~'), '.cache')
+    path = os.path.join(base, APP_DIR_NAME)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def file_digest(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """SHA-256 вмісту файлу (читання частинами, без завантаження файлу цілком)"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DiskCache:
+    """Сховище ключ-значення у SQLite з витісненням найдавніше використаних записів.
+
+    Кожен процес відкриває власне з'єднання, тому кеш можна використовувати
+    одночасно з кількох процесів-воркерів.
+    """
+
+    def __init__(self, db_path: str, max_bytes: int):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self._conn = sqlite3.connect(db_path, timeout=30)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                accessed REAL NOT NULL
+            )
+        ''')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries(accessed)')
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[bytes]:
+        row = self._conn.execute('SELECT value FROM entries WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        self._conn.execute('UPDATE entries SET accessed = ? WHERE key = ?', (time.time(), key))
+        self._conn.commit()
+        return row[0]
+
+    def put(self, key: str, value: bytes):
+        self._conn.execute(
+            'INSERT OR REPLACE INTO entries (key, value, size, accessed) VALUES (?, ?, ?, ?)',
+            (key, value, len(value), time.time())
+        )
+        self._conn.commit()
+        self._evict()
+
+    def total_size(self) -> int:
+        return self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+
+    def clear(self):
+        """Повне очищення кешу"""
+        self._conn.execute('DELETE FROM entries')
+        self._conn.commit()
+        self._conn.execute('VACUUM')
+
+    def close(self):
+        self._conn.close()
+
+    def _evict(self):
+        """Видалення найдавніше використаних записів, поки кеш перевищує ліміт"""
+        total = self.total_size()
+        if total <= self.max_bytes:
+            return
+
+        # Звільняємо з запасом, щоб не витісняти після кожного запису
+        target = int(self.max_bytes * 0.9)
+        removed_keys = []
+        for key, size in self._conn.execute('SELECT key, size FROM entries ORDER BY accessed'):
+            if total <= target:
+                break
+            removed_keys.append((key,))
+            total -= size
+
+        self._conn.executemany('DELETE FROM entries WHERE key = ?', removed_keys)
+        self._conn.commit()
+
+
+class ParseCache:
+    """Кеш результатів parse_document за хешем вмісту файлу та версією парсера"""
+
+    DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+    def __init__(self, parser_fingerprint: str, db_path: Optional[str] = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.parser_fingerprint = parser_fingerprint
+        self.store = DiskCache(db_path or os.path.join(user_data_dir(), 'parse_cache.sqlite3'), max_bytes)
+
+    def _key(self, file_hash: str) -> str:
+        return f"{self.parser_fingerprint}:{file_hash}"
+
+    def get(self, file_hash: str) -> Optional[Dict]:
+        value = self.store.get(self._key(file_hash))
+        return json.loads(value.decode('utf-8')) if value is not None else None
+
+    def put(self, file_hash: str, result: Dict):
+        value = json.dumps(result, ensure_ascii=False, default=str).encode('utf-8')
+        self.store.put(self._key(file_hash), value)
+
+    def clear(self):
+        self.store.clear()
+
+    def close(self):
+        self.store.close()
+
+
+class OcrCache:
+    """Кеш тексту OCR за хешем декодованого зображення та налаштуваннями розпізнавання.
+
+    Ключ не залежить від імені та формату файлу, тому копія фото в іншій
+    папці чи перезбережене без змін зображення беруться з кешу. Зміна
+    конфігурації tesseract чи попередньої обробки дає новий ключ.
+    """
+
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, settings: str, db_path: Optional[str] = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.settings = hashlib.sha256(settings.encode('utf-8')).hexdigest()[:16]
+        self.store = DiskCache(db_path or os.path.join(user_data_dir(), 'ocr_cache.sqlite3'), max_bytes)
+
+    def _key(self, image_hash: str) -> str:
+        return f"{self.settings}:{image_hash}"
+
+    def get(self, image_hash: str) -> Optional[str]:
+        value = self.store.get(self._key(image_hash))
+        return value.decode('utf-8') if value is not None else None
+
+    def put(self, image_hash: str, text: str):
+        self.store.put(self._key(image_hash), text.encode('utf-8'))
+
+    def clear(self):
+        self.store.clear()
+
+    def close(self):
+        self.store.close()
@@ -0,0 +1,99 @@
+import zipfile
+from typing import Iterator, List
+from xml.etree.ElementTree import iterparse
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_MC = '{http://schemas.openxmlformats.org/markup-compatibility/2006}'
+
+_BODY = _W + 'body'
+_PARAGRAPH = _W + 'p'
+_TEXT = _W + 't'
+_TAB = _W + 'tab'
+_BREAKS = (_W + 'br', _W + 'cr')
+_ROW = _W + 'tr'
+_CELL = _W + 'tc'
+# Запасний варіант вмісту (наприклад, копія напису) дублює основний — пропускаємо
+_FALLBACK = _MC + 'Fallback'
+
+# Розділювач клітинок рядка таблиці: рядок таблиці стає одним рядком тексту
+CELL_SEPARATOR = '\t'
+
+
+def iter_docx_blocks(file_path: str) -> Iterator[str]:
+    """Текст абзаців і рядків таблиць DOCX у порядку документа.
+
+    word/document.xml читається потоково (iterparse) прямо з архіву, без
+    побудови об'єктної моделі документа. Кожен абзац видається окремо;
+    рядок таблиці — одним блоком, клітинки розділені табуляцією, абзаци
+    всередині клітинки — пробілом. Оброблені елементи тіла документа
+    відразу звільняються, тож пам'ять не росте з розміром файлу.
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        with archive.open('word/document.xml') as xml:
+            body = None
+            depth = 0
+            skip_depth = 0
+            paragraphs: List[List[str]] = []
+            rows: List[List[str]] = []
+            cells: List[List[str]] = []
+
+            for event, element in iterparse(xml, events=('start', 'end')):
+                tag = element.tag
+                if event == 'start':
+                    depth += 1
+                    if skip_depth:
+                        continue
+                    if tag == _FALLBACK:
+                        skip_depth = depth
+                    elif tag == _PARAGRAPH:
+                        paragraphs.append([])
+                    elif tag == _CELL:
+                        cells.append([])
+                    elif tag == _ROW:
+                        rows.append([])
+                    elif tag == _BODY:
+                        body = element
+                    continue
+
+                depth -= 1
+                if skip_depth:
+                    if depth < skip_depth:
+                        skip_depth = 0
+                    continue
+
+                if tag == _TEXT:
+                    if paragraphs and element.text:
+                        paragraphs[-1].append(element.text)
+                elif tag == _TAB:
+                    if paragraphs:
+                        paragraphs[-1].append('\t')
+                elif tag in _BREAKS:
+                    if paragraphs:
+                        paragraphs[-1].append('\n')
+                elif tag == _PARAGRAPH:
+                    text = ''.join(paragraphs.pop())
+                    if cells:
+                        cells[-1].append(text)
+                    elif paragraphs:
+                        # Абзац усередині абзацу (напис) доповнює зовнішній
+                        paragraphs[-1].append(text)
+                    else:
+                        yield text
+                elif tag == _CELL:
+                    rows[-1].append(' '.join(text for text in cells.pop() if text))
+                elif tag == _ROW:
+                    line = CELL_SEPARATOR.join(rows.pop())
+                    if cells:
+                        # Вкладена таблиця стає частиною клітинки зовнішньої
+                        cells[-1].append(line)
+                    else:
+                        yield line
+
+                if body is not None and depth == 2:
+                    # Завершено елемент верхнього рівня тіла документа
+                    body.clear()
+
+
+def read_docx_text(file_path: str) -> str:
+    """Повний текст DOCX (абзаци та таблиці) одним рядком"""
+    return '\n'.join(iter_docx_blocks(file_path))
@@ -0,0 +1,66 @@
+import re
+from datetime import date
+from typing import Dict, Iterator, Optional, Tuple
+
+# Місяці у формі родового відмінка, як у датах наказів («12 травня 2024»)
+MONTHS = {
+    'січня': 1, 'лютого': 2, 'березня': 3, 'квітня': 4, 'травня': 5, 'червня': 6,
+    'липня': 7, 'серпня': 8, 'вересня': 9, 'жовтня': 10, 'листопада': 11, 'грудня': 12,
+}
+
+_NUMERIC_DATE_RE = re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{4})')
+_TEXT_DATE_RE = re.compile(r'(\d{1,2})\s+([а-яіїєґ]+)\s+(\d{4})', re.IGNORECASE)
+_AMOUNT_RE = re.compile(r'\d+(?:[  ]\d{3})*(?:[.,]\d+)?')
+
+
+def parse_order_date(value: Optional[str]) -> Optional[date]:
+    """Дата наказу з тексту («12.05.2024» або «12 травня 2024»); None, якщо не розпізнано"""
+    if not value:
+        return None
+    match = _NUMERIC_DATE_RE.search(value)
+    if match:
+        day, month, year = (int(part) for part in match.groups())
+    else:
+        match = _TEXT_DATE_RE.search(value)
+        if not match or match.group(2).lower() not in MONTHS:
+            return None
+        day, month, year = int(match.group(1)), MONTHS[match.group(2).lower()], int(match.group(3))
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def parse_amount(value: Optional[str]) -> Optional[float]:
+    """Число з суми чи відсотка («5 000 грн», «25,5») для типізованих колонок"""
+    if value is None:
+        return None
+    match = _AMOUNT_RE.search(str(value))
+    if not match:
+        return None
+    return float(match.group(0).replace(' ', '').replace(' ', '').replace(',', '.'))
+
+
+def parse_point_number(value) -> Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def iter_personnel_changes(order: Dict) -> Iterator[Tuple[Dict, Dict]]:
+    """Пари (пункт наказу, особа); особи без ПІБ пропускаються.
+
+    Пункти беруться з advanced_data; для записів без нього (експорт slim)
+    — зі спрощеного списку personnel, де дія записана в самій особі.
+    """
+    advanced = order.get('advanced_data') or {}
+    if 'personnel_changes' not in advanced:
+        for person in order.get('personnel', []):
+            if person.get('full_name'):
+                yield {'type': person.get('action')}, person
+        return
+    for change in advanced.get('personnel_changes', []):
+        for person in change.get('personnel_data', []):
+            if person.get('full_name'):
+                yield change, person
@@ -0,0 +1,58 @@
+import os
+from typing import Callable, Dict, List, Optional, Tuple
+
+from disk_cache import file_digest
+
+
+class FolderWatcher:
+    """Відстеження змін у наборі файлів між послідовними скануваннями.
+
+    Для кожного файлу зберігається знімок (mtime, розмір, хеш вмісту). Хеш
+    перераховується лише тоді, коли змінились mtime або розмір, тому повторне
+    сканування незмінної папки зводиться до stat() кожного файлу.
+    """
+
+    def __init__(self, list_files: Callable[[], List[str]]):
+        self.list_files = list_files
+        # шлях -> (mtime, розмір, хеш)
+        self.snapshot: Dict[str, Tuple[Optional[float], Optional[int], Optional[str]]] = {}
+
+    def seed(self, known_hashes: Dict[str, str]):
+        """Початковий знімок з уже проаналізованих файлів (шлях -> хеш вмісту).
+
+        mtime та розмір невідомі, тому при першому скануванні ці файли буде
+        перехешовано, але повторно розібрано лише ті, що справді змінились.
+        """
+        for path, file_hash in known_hashes.items():
+            self.snapshot[os.path.abspath(path)] = (None, None, file_hash)
+
+    def scan(self) -> Tuple[List[str], List[str]]:
+        """Сканування: повертає (нові або змінені файли, видалені файли)"""
+        changed = []
+        current = {}
+
+        for path in self.list_files():
+            path = os.path.abspath(path)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                # Файл зник між переліком та stat()
+                continue
+
+            previous = self.snapshot.get(path)
+            if previous is not None and previous[0] == stat.st_mtime and previous[1] == stat.st_size:
+                current[path] = previous
+                continue
+
+            try:
+                file_hash = file_digest(path)
+            except OSError:
+                continue
+
+            current[path] = (stat.st_mtime, stat.st_size, file_hash)
+            if previous is None or previous[2] != file_hash:
+                changed.append(path)
+
+        removed = [path for path in self.snapshot if path not in current]
+        self.snapshot = current
+        return changed, removed
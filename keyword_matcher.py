@@ -0,0 +1,64 @@
+import re
+from typing import Dict, List, Optional, Tuple, Union
+
+
+class KeywordMatcher:
+    """Пошук ключових слів усіх категорій (типи наказів, дії, звання) за один прохід.
+
+    Усі ключові слова об'єднуються в один регулярний вираз без урахування
+    регістру; довші варіанти стоять в альтернації першими, тому в кожній
+    позиції перемагає найдовший збіг («старший сержант», а не «сержант»).
+    Текст не переводиться в нижній регістр для кожного ключового слова окремо.
+
+    Якщо в тексті є ключові слова кількох міток однієї категорії, обирається
+    мітка, що стоїть раніше в шаблонах (як і при послідовній перевірці міток),
+    а не та, що раніше трапилась у тексті.
+    """
+
+    def __init__(self, categories: Dict[str, Dict[str, List[str]]]):
+        # ключове слово (нижній регістр) -> {категорія: (пріоритет, мітка)}
+        self._labels: Dict[str, Dict[str, Tuple[int, str]]] = {}
+        for category, groups in categories.items():
+            for priority, (label, keywords) in enumerate(groups.items()):
+                for keyword in keywords:
+                    owners = self._labels.setdefault(keyword.lower(), {})
+                    owners.setdefault(category, (priority, label))
+
+        self.categories = tuple(categories)
+        alternation = '|'.join(re.escape(keyword)
+                               for keyword in sorted(self._labels, key=len, reverse=True))
+        self._regex = re.compile(alternation or r'(?!)', re.IGNORECASE)
+
+    @classmethod
+    def from_patterns(cls, patterns: Dict) -> 'KeywordMatcher':
+        """Побудова з шаблонів у форматі patterns.json"""
+        return cls({
+            'order_type': {label: _as_list(keywords)
+                           for label, keywords in patterns.get('order_types', {}).items()},
+            'action': {label: _as_list(keywords)
+                       for label, keywords in patterns.get('actions', {}).items()},
+            'rank': {rank: [rank] for rank in patterns.get('ranks', [])}
+        })
+
+    def scan(self, text: str) -> Dict[str, str]:
+        """Мітка з найвищим пріоритетом для кожної категорії за один прохід по тексту"""
+        return self._best(text, self.categories)
+
+    def first(self, text: str, category: str) -> Optional[str]:
+        """Мітка з найвищим пріоритетом однієї категорії"""
+        return self._best(text, (category,)).get(category)
+
+    def _best(self, text: str, categories: Tuple[str, ...]) -> Dict[str, str]:
+        best: Dict[str, Tuple[int, str]] = {}
+        for match in self._regex.finditer(text):
+            for category, (priority, label) in self._labels[match.group(0).lower()].items():
+                if category in categories and (category not in best or priority < best[category][0]):
+                    best[category] = (priority, label)
+            # Мітку з найвищим пріоритетом вже знайдено в усіх категоріях
+            if len(best) == len(categories) and all(priority == 0 for priority, _ in best.values()):
+                break
+        return {category: label for category, (_, label) in best.items()}
+
+
+def _as_list(keywords: Union[str, List[str]]) -> List[str]:
+    return [keywords] if isinstance(keywords, str) else list(keywords)
@@ -1,19 +1,50 @@
+import time
+
+# Момент запуску програми: від нього міряється час до появи вікна
+_STARTED_AT = time.perf_counter()
+
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import itertools
 import os
+import queue
+import sys
 import threading
+import multiprocessing
 import webbrowser
 from pathlib import Path
-from typing import Dict, List  # Додано необхідний імпорт
+from typing import Dict, Iterator, List, Optional  # Додано необхідний імпорт
 
-# Імпорт наших модулів
+# Імпорт наших модулів (бібліотеки форматів та експорту завантажуються при першому використанні)
 try:
-    from universal_parser import UniversalOrderParser
-    from modern_exporter import ModernExporter
+    from batch_engine import BatchEngine, clear_parse_cache
+    from discovery import DiscoveryStream, iter_document_files
+    from folder_watcher import FolderWatcher
+    from results_store import ResultsStore
+    from virtual_table import VirtualTable
 except ImportError as e:
     messagebox.showerror("Помилка імпорту", f"Не вдалося завантажити модулі: {e}\n\nПереконайтесь, що всі файли в одній папці:")
     exit()
 
+# Інтервал перевірки папки в режимі стеження
+WATCH_INTERVAL_MS = 5000
+
+# Інтервал обробки черги оновлень інтерфейсу та найбільша кількість оновлень за один такт
+UI_TICK_MS = 100
+UI_BATCH_SIZE = 500
+
+# Прогрес і статус аналізу оновлюються не частіше ніж раз на цей інтервал
+PROGRESS_INTERVAL_SECONDS = 0.25
+
+# Скільки найчастіших значень показувати в кожному розподілі статистики
+STATS_TOP_ITEMS = 15
+
+# Рядків детальної інформації, що вставляються за один такт
+DETAILS_CHUNK_LINES = 200
+
+# Бюджет часу від запуску до появи вікна (перевіряється benchmarks/bench_startup.py)
+STARTUP_BUDGET_SECONDS = 1.5
+
 class ModernOrderAnalyzerApp:
     def __init__(self, root):
         self.root = root
@@ -30,12 +61,81 @@ class ModernOrderAnalyzerApp:
         except:
             pass
         
-        self.parser = UniversalOrderParser()
-        self.exporter = ModernExporter()
-        self.orders_data = []
+        self._exporter = None
+        self.startup_seconds = None
+        self.results = ResultsStore()
         self.processing = False
+        self.engine = None
+        
+        # Фонові потоки не звертаються до Tk: оновлення ставляться в чергу
+        # і виконуються головним потоком на такті after()
+        self.ui_queue = queue.Queue()
+        self.analysis_run = 0
+        self.analysis_progress = None
+        self._progress_shown_at = 0.0
+        self.details_render = 0
+        
+        # Стеження за папкою
+        self.watcher = None
+        self.watch_engine = None
+        self.watch_busy = False
         
         self.setup_ui()
+        self.root.after_idle(self.on_window_ready)
+        self.root.after(UI_TICK_MS, self.drain_ui_queue)
+    
+    def on_window_ready(self):
+        """Вікно показане: фіксуємо час запуску"""
+        self.startup_seconds = time.perf_counter() - _STARTED_AT
+        if self.startup_seconds > STARTUP_BUDGET_SECONDS:
+            print(f"Увага: запуск зайняв {self.startup_seconds:.2f} с "
+                  f"(бюджет {STARTUP_BUDGET_SECONDS} с)", file=sys.stderr)
+    
+    def post(self, callback, *args):
+        """Виконання callback(*args) у головному потоці (викликається з будь-якого потоку)"""
+        self.ui_queue.put((callback, args))
+    
+    def drain_ui_queue(self):
+        """Такт головного потоку: пакетне застосування оновлень з черги"""
+        try:
+            for _ in range(UI_BATCH_SIZE):
+                try:
+                    callback, args = self.ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                callback(*args)
+            self.show_progress()
+        finally:
+            self.root.after(UI_TICK_MS, self.drain_ui_queue)
+    
+    def show_progress(self):
+        """Прогрес аналізу та поточна статистика з обмеженням частоти оновлень"""
+        if self.analysis_progress is None:
+            return
+        now = time.perf_counter()
+        if now - self._progress_shown_at < PROGRESS_INTERVAL_SECONDS:
+            return
+        self._progress_shown_at = now
+        
+        processed_count, discovered, finished, file_path = self.analysis_progress
+        # Загальна кількість росте, поки триває пошук файлів
+        total_label = f"{discovered}" if finished else f"{discovered}+"
+        self.status_var.set(f"🔍 Аналіз {processed_count}/{total_label}: {os.path.basename(file_path)}")
+        self.progress['value'] = (processed_count / max(discovered, 1)) * 100
+        self.update_stats()
+    
+    @property
+    def exporter(self):
+        """Експортер створюється при першому експорті"""
+        if self._exporter is None:
+            from modern_exporter import ModernExporter
+            self._exporter = ModernExporter()
+        return self._exporter
+    
+    @property
+    def orders_data(self) -> List[Dict]:
+        """Результати аналізу у порядку файлів"""
+        return self.results.records
     
     def center_window(self):
         """Центрування вікна на екрані"""
@@ -83,7 +183,9 @@ class ModernOrderAnalyzerApp:
             ("📁 ОБРАТИ ПАПКУ", self.select_folder, '#0984e3'),
             ("🔍 ПОЧАТИ АНАЛІЗ", self.start_analysis, '#00b894'),
             ("⏹️ ЗУПИНИТИ", self.stop_analysis, '#d63031'),
-            ("👁️ ПЕРЕГЛЯНУТИ", self.show_details, '#fd79a8')
+            ("👁️ ПЕРЕГЛЯНУТИ", self.show_details, '#fd79a8'),
+            ("👀 СТЕЖИТИ ЗА ПАПКОЮ", self.toggle_watch, '#e17055'),
+            ("♻️ ПЕРЕБУДУВАТИ КЕШ", self.rebuild_cache, '#6c5ce7')
         ]
         
         for text, command, color in actions:
@@ -94,6 +196,8 @@ class ModernOrderAnalyzerApp:
                           padx=20, pady=12,
                           cursor='hand2')
             btn.pack(side=tk.LEFT, padx=8)
+            if command == self.toggle_watch:
+                self.watch_button = btn
             btn.bind("<Enter>", lambda e, b=btn: b.configure(bg='#2d3436'))
             btn.bind("<Leave>", lambda e, b=btn, c=color: b.configure(bg=c))
         
@@ -107,9 +211,12 @@ class ModernOrderAnalyzerApp:
         
         export_options = [
             ("🌐 HTML ЗВІТ", "html"),
-            ("📊 JSON ДАНІ", "json"), 
+            ("📊 JSON ДАНІ", "json"),
+            ("📜 NDJSON", "ndjson"),
             ("📋 CSV ФАЙЛИ", "csv"),
-            ("💼 EXCEL", "excel")
+            ("💼 EXCEL", "excel"),
+            ("🗄️ SQLITE", "sqlite"),
+            ("🧱 PARQUET", "parquet")
         ]
         
         for text, format_type in export_options:
@@ -162,40 +269,22 @@ class ModernOrderAnalyzerApp:
         main_tab = ttk.Frame(self.notebook)
         self.notebook.add(main_tab, text="📋 ОСНОВНІ РЕЗУЛЬТАТИ")
         
-        # Створюємо Treeview з сіткою
-        columns = ('Файл', 'Тип', 'Номер', 'Дата', 'Осіб', 'Статус')
-        
-        # Frame для Treeview та scrollbar
-        tree_frame = ttk.Frame(main_tab)
-        tree_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        # Treeview
-        self.tree = ttk.Treeview(tree_frame, columns=columns, show='headings', height=20)
-        
-        # Налаштування колонок
-        column_config = {
-            'Файл': 250,
-            'Тип': 150, 
-            'Номер': 100,
-            'Дата': 120,
-            'Осіб': 80,
-            'Статус': 150
-        }
-        
-        for col in columns:
-            self.tree.heading(col, text=col)
-            self.tree.column(col, width=column_config[col])
-        
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
+        # Віртуальна таблиця: рядки створюються лише для видимої частини результатів
+        columns = (
+            ('Файл', 250),
+            ('Тип', 150),
+            ('Номер', 100),
+            ('Дата', 120),
+            ('Осіб', 80),
+            ('Статус', 150)
+        )
         
-        # Pack
-        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.table = VirtualTable(main_tab, columns, self.table_values)
+        self.table.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.table.set_source(self.results.records)
         
         # Подвійне клацання
-        self.tree.bind('<Double-1>', self.on_double_click)
+        self.table.bind_rows('<Double-1>', self.on_double_click)
     
     def setup_details_tab(self):
         """Налаштування вкладки з детальним аналізом"""
@@ -253,85 +342,237 @@ class ModernOrderAnalyzerApp:
             return
         
         self.processing = True
-        self.orders_data = []
-        self.tree.delete(*self.tree.get_children())
+        # Новий номер запуску робить застарілими і результати циклу стеження,
+        # що ще виконується: вони не потраплять до щойно очищеного сховища
+        self.analysis_run += 1
+        if self.watch_engine is not None:
+            self.watch_engine.cancel()
+        self.analysis_progress = None
+        self.results.clear()
+        self.table.reset()
+        self.status_var.set("🔎 Пошук документів...")
         
         # Запуск в окремому потоці
-        thread = threading.Thread(target=self.analyze_documents)
+        thread = threading.Thread(target=self.analyze_documents, args=(self.analysis_run,))
         thread.daemon = True
         thread.start()
     
     def stop_analysis(self):
         """Зупинка аналізу"""
         self.processing = False
+        if self.engine is not None:
+            self.engine.cancel()
+        self.analysis_progress = None
         self.status_var.set("⏹️ Аналіз зупинено")
         self.progress['value'] = 0
     
-    def analyze_documents(self):
-        """Аналіз документів"""
+    def rebuild_cache(self):
+        """Очищення кешу результатів: наступний аналіз заново розбере всі файли"""
+        if self.processing:
+            messagebox.showwarning("Увага", "⏳ Дочекайтесь завершення аналізу")
+            return
+        
+        if not messagebox.askyesno("Перебудувати кеш",
+                                   "♻️ Очистити кеш результатів?\n\n"
+                                   "Під час наступного аналізу всі файли буде розібрано заново."):
+            return
+        
         try:
-            supported_extensions = ('.txt', '.docx', '.pdf', '.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif')
-            files = [f for f in os.listdir(self.folder_path) 
-                    if f.lower().endswith(supported_extensions)]
-            
-            if not files:
-                self.status_var.set("❌ В обраній папці не знайдено підтримуваних файлів")
-                return
+            clear_parse_cache()
+            self.status_var.set("♻️ Кеш очищено. Наступний аналіз перебудує його")
+        except Exception as e:
+            messagebox.showerror("Помилка", f"❌ Не вдалося очистити кеш: {str(e)}")
+    
+    def analyze_documents(self, run: int):
+        """Аналіз документів пулом процесів (фоновий потік, без звернень до Tk)"""
+        try:
+            # Пошук файлів у підпапках іде паралельно з парсингом
+            folder_path = self.folder_path
+            discovery = DiscoveryStream(lambda: iter_document_files(folder_path, onerror=discovery.skip))
+            processed_count = 0
             
-            total_files = len(files)
+            def on_result(index: int, file_path: str, order_data: Dict):
+                nonlocal processed_count
+                # Індекс файлу як ключ порядку: результат стає на своє місце у таблиці
+                self.post(self.place_run_result, run, order_data, index)
+                processed_count += 1
+                if run == self.analysis_run:
+                    self.analysis_progress = (processed_count, discovery.discovered, discovery.finished, file_path)
             
-            for i, filename in enumerate(files):
-                if not self.processing:
-                    break
-                    
-                file_path = os.path.join(self.folder_path, filename)
-                self.status_var.set(f"🔍 Аналіз {i+1}/{total_files}: {filename}")
-                
-                # Парсинг документу
-                order_data = self.parser.parse_document(file_path)
-                self.orders_data.append(order_data)
-                
-                # Оновлення прогресу
-                progress_percent = ((i + 1) / total_files) * 100
-                self.progress['value'] = progress_percent
-                
-                # Додавання в таблицю
-                self.add_to_treeview(order_data)
-                self.root.update()
+            self.engine = BatchEngine()
+            processed = self.engine.run(discovery, on_result, should_stop=lambda: not self.processing)
+            self.post(self.finish_analysis, run, processed, discovery.discovered, discovery.problems())
+        except Exception as e:
+            self.post(self.fail_analysis, run, str(e))
+    
+    def place_run_result(self, run: int, order_data: Dict, order_key: Optional[int] = None):
+        """Результат аналізу або циклу стеження; результати застарілого запуску відкидаються"""
+        if run == self.analysis_run:
+            self.place_result(order_data, order_key)
+    
+    def drop_run_result(self, run: int, file_path: str):
+        """Видалення результату циклом стеження, якщо відтоді не почався новий аналіз"""
+        if run == self.analysis_run:
+            self.drop_result(file_path)
+    
+    def finish_analysis(self, run: int, processed: int, total_files: int, problems: List[str]):
+        """Завершення аналізу в головному потоці, після всіх його результатів у черзі.
+
+        problems — причини неповного пошуку файлів (DiscoveryStream.problems).
+        """
+        if run != self.analysis_run:
+            return
+        completed = self.processing
+        self.end_analysis()
+        
+        if total_files == 0 and completed and not problems:
+            self.status_var.set("❌ В обраній папці не знайдено підтримуваних файлів")
+            return
+        
+        if completed and problems:
+            success_count = self.results.stats.successful_orders
+            self.status_var.set(f"⚠️ Аналіз завершено не повністю: {problems[0]}")
+            self.update_stats()
             
-            if self.processing:
-                success_count = len([o for o in self.orders_data if 'error' not in o])
-                self.status_var.set(f"✅ Аналіз завершено! Успішно: {success_count}/{total_files}")
-                self.update_stats()
-                
-                messagebox.showinfo("Готово", 
-                                  f"🎉 Аналіз завершено успішно!\n\n"
-                                  f"📊 Оброблено документів: {total_files}\n"
-                                  f"✅ Успішно: {success_count}\n"
-                                  f"❌ З помилками: {total_files - success_count}\n\n"
-                                  f"Тепер ви можете експортувати результати!")
-            else:
-                self.status_var.set(f"⏹️ Аналіз зупинено. Оброблено {len(files)} файлів")
+            messagebox.showwarning("Пошук неповний",
+                                   f"⚠️ Знайдено не всі документи:\n\n"
+                                   + '\n'.join(f"• {problem}" for problem in problems)
+                                   + f"\n\n📊 Оброблено документів: {total_files}\n"
+                                   f"✅ Успішно: {success_count}\n"
+                                   f"❌ З помилками: {total_files - success_count}")
+        elif completed:
+            success_count = self.results.stats.successful_orders
+            self.status_var.set(f"✅ Аналіз завершено! Успішно: {success_count}/{total_files}")
+            self.update_stats()
             
-        except Exception as e:
-            messagebox.showerror("Помилка", f"❌ Помилка під час аналізу: {str(e)}")
-        finally:
-            self.processing = False
-            self.progress['value'] = 0
+            messagebox.showinfo("Готово", 
+                              f"🎉 Аналіз завершено успішно!\n\n"
+                              f"📊 Оброблено документів: {total_files}\n"
+                              f"✅ Успішно: {success_count}\n"
+                              f"❌ З помилками: {total_files - success_count}\n\n"
+                              f"Тепер ви можете експортувати результати!")
+        else:
+            self.status_var.set(f"⏹️ Аналіз зупинено. Оброблено {processed} з {total_files} файлів")
+    
+    def fail_analysis(self, run: int, error: str):
+        if run != self.analysis_run:
+            return
+        self.end_analysis()
+        messagebox.showerror("Помилка", f"❌ Помилка під час аналізу: {error}")
+    
+    def end_analysis(self):
+        self.engine = None
+        self.processing = False
+        self.analysis_progress = None
+        self.progress['value'] = 0
+    
+    def list_folder_files(self, folder_path: str) -> List[str]:
+        """Перелік підтримуваних файлів у папці та її підпапках"""
+        return list(iter_document_files(folder_path))
+    
+    def place_result(self, order_data: Dict, order_key=None):
+        """Додавання або оновлення результату у сховищі; таблиця перемальовується при простої"""
+        self.results.put(order_data, order_key)
+        self.table.upsert_row(order_data)
+    
+    def drop_result(self, file_path: str):
+        """Видалення результату для видаленого файлу"""
+        removed = self.results.remove(file_path)
+        if removed is not None:
+            self.table.remove_row(removed)
     
-    def add_to_treeview(self, order_data: Dict):
-        """Додавання даних до таблиці"""
+    def table_values(self, order_data: Dict) -> tuple:
+        """Значення рядка таблиці для документа"""
         status = "✅ Успішно" if 'error' not in order_data else f"❌ {order_data['error'][:30]}..."
         personnel_count = len(order_data.get('personnel', []))
         
-        self.tree.insert('', 'end', values=(
+        return (
             order_data['file_name'],
             order_data.get('type', 'невідомо'),
             order_data.get('number', 'н/д'),
             order_data.get('date', 'н/д'),
             personnel_count,
             status
-        ))
+        )
+    
+    def toggle_watch(self):
+        """Увімкнення/вимкнення стеження за папкою"""
+        if self.watcher is not None:
+            self.watcher = None
+            if self.watch_engine is not None:
+                self.watch_engine.cancel()
+            self.watch_button.configure(text="👀 СТЕЖИТИ ЗА ПАПКОЮ")
+            self.status_var.set("⏹️ Стеження за папкою вимкнено")
+            return
+        
+        if not hasattr(self, 'folder_path'):
+            messagebox.showwarning("Увага", "📁 Спочатку оберіть папку з документами")
+            return
+        
+        folder_path = self.folder_path
+        self.watcher = FolderWatcher(lambda: self.list_folder_files(folder_path))
+        # Вже проаналізовані файли не розбираються повторно, якщо їх вміст не змінився
+        self.watcher.seed({o['file_path']: o['file_hash'] for o in self.orders_data if o.get('file_hash')})
+        self.watch_button.configure(text="⏸️ ЗУПИНИТИ СТЕЖЕННЯ")
+        self.status_var.set(f"👀 Стеження за папкою: {os.path.basename(folder_path)}")
+        self.watch_tick()
+    
+    def schedule_watch(self):
+        if self.watcher is not None:
+            self.root.after(WATCH_INTERVAL_MS, self.watch_tick)
+    
+    def watch_tick(self):
+        """Періодична перевірка папки (не перетинається з повним аналізом)"""
+        if self.watcher is None:
+            return
+        if self.processing or self.watch_busy:
+            self.schedule_watch()
+            return
+        
+        self.watch_busy = True
+        thread = threading.Thread(target=self.watch_cycle, args=(self.watcher, self.analysis_run))
+        thread.daemon = True
+        thread.start()
+    
+    def watch_cycle(self, watcher: FolderWatcher, run: int):
+        """Інкрементальний аналіз: розбираються лише нові та змінені файли (фоновий потік).
+
+        run — номер аналізу, на результатах якого базується цикл; якщо тим
+        часом почався новий аналіз, цикл зупиняється, а його результати
+        відкидаються.
+        """
+        try:
+            changed, removed = watcher.scan()
+            
+            for file_path in removed:
+                self.post(self.drop_run_result, run, file_path)
+            
+            if changed:
+                self.post(self.status_var.set, f"👀 Аналіз змінених файлів: {len(changed)}")
+                self.watch_engine = BatchEngine()
+                self.watch_engine.run(changed,
+                                      lambda index, file_path, order_data:
+                                          self.post(self.place_run_result, run, order_data),
+                                      should_stop=lambda: self.watcher is not watcher or self.analysis_run != run)
+            
+            if changed or removed:
+                self.post(self.finish_watch_cycle, run, len(changed), len(removed))
+        except Exception as e:
+            self.post(self.status_var.set, f"❌ Помилка стеження: {str(e)}")
+        finally:
+            self.watch_engine = None
+            self.post(self.end_watch_cycle)
+    
+    def finish_watch_cycle(self, run: int, changed_count: int, removed_count: int):
+        if run != self.analysis_run:
+            return
+        self.update_stats()
+        self.status_var.set(f"👀 Оновлено: змінено {changed_count}, видалено {removed_count}. "
+                            f"Всього документів: {len(self.orders_data)}")
+    
+    def end_watch_cycle(self):
+        self.watch_busy = False
+        self.schedule_watch()
     
     def on_double_click(self, event):
         """Обробка подвійного клацання"""
@@ -339,81 +580,85 @@ class ModernOrderAnalyzerApp:
     
     def show_details(self):
         """Показати детальну інформацію"""
-        selection = self.tree.selection()
-        if not selection:
+        file_path = self.table.selected_key()
+        if file_path is None:
             messagebox.showwarning("Увага", "👆 Оберіть документ з таблиці")
             return
         
-        item = self.tree.selection()[0]
-        values = self.tree.item(item, 'values')
-        file_name = values[0]
-        
-        # Знаходимо відповідні дані
-        order_data = next((o for o in self.orders_data if o['file_name'] == file_name), None)
+        # Запис за повним шляхом файлу: однакові імена в різних підпапках не плутаються
+        order_data = self.results.get(file_path)
         
         if not order_data:
             messagebox.showerror("Помилка", "❌ Дані не знайдено")
             return
         
-        # Формуємо детальну інформацію
-        details = self.format_detailed_info(order_data)
-        
-        # Оновлюємо текстове поле
+        # Оновлюємо текстове поле: реквізити одразу, решта — частинами на наступних тактах
+        self.details_render += 1
         self.details_text.delete(1.0, tk.END)
-        self.details_text.insert(1.0, details)
+        self.render_details(self.details_render, self.iter_detail_lines(order_data))
         
         # Переходимо на вкладку деталей
         self.notebook.select(1)
     
-    def format_detailed_info(self, order_data: Dict) -> str:
-        """Форматування детальної інформації"""
-        details = []
-        details.append("=" * 80)
-        details.append("🔍 ДЕТАЛЬНИЙ АНАЛІЗ ДОКУМЕНТУ")
-        details.append("=" * 80)
-        details.append(f"📄 Файл: {order_data.get('file_name', 'н/д')}")
-        details.append(f"📁 Тип файлу: {order_data.get('file_type', 'н/д')}")
-        details.append(f"🔢 Номер наказу: {order_data.get('number', 'н/д')}")
-        details.append(f"📅 Дата наказу: {order_data.get('date', 'н/д')}")
-        details.append(f"⏰ Час обробки: {order_data.get('processing_time', 'н/д')}")
-        details.append("")
+    def render_details(self, render: int, lines: Iterator[str]):
+        """Вставка наступної частини рядків; відкритий інший документ перериває показ"""
+        if render != self.details_render:
+            return
+        chunk = list(itertools.islice(lines, DETAILS_CHUNK_LINES))
+        if not chunk:
+            return
+        self.details_text.insert(tk.END, '\n'.join(chunk) + '\n')
+        self.root.after(1, self.render_details, render, lines)
+    
+    def iter_detail_lines(self, order_data: Dict) -> Iterator[str]:
+        """Рядки детальної інформації: спершу реквізити, далі пункти наказу"""
+        yield "=" * 80
+        yield "🔍 ДЕТАЛЬНИЙ АНАЛІЗ ДОКУМЕНТУ"
+        yield "=" * 80
+        yield f"📄 Файл: {order_data.get('file_name', 'н/д')}"
+        yield f"📁 Тип файлу: {order_data.get('file_type', 'н/д')}"
+        if order_data.get('encoding'):
+            yield f"🔤 Кодування: {order_data['encoding']}"
+        yield f"🔢 Номер наказу: {order_data.get('number', 'н/д')}"
+        yield f"📅 Дата наказу: {order_data.get('date', 'н/д')}"
+        yield f"⏰ Час обробки: {order_data.get('processing_time', 'н/д')}"
+        yield ""
         
         if 'error' in order_data:
-            details.append("❌ ПОМИЛКА ОБРОБКИ:")
-            details.append("-" * 40)
-            details.append(f"   {order_data['error']}")
-            details.append("")
+            yield "❌ ПОМИЛКА ОБРОБКИ:"
+            yield "-" * 40
+            yield f"   {order_data['error']}"
+            yield ""
         
         if 'advanced_data' in order_data and order_data['advanced_data']:
             adv_data = order_data['advanced_data']
             
-            details.append("👥 ЗМІНИ ПЕРСОНАЛУ:")
-            details.append("-" * 40)
+            yield "👥 ЗМІНИ ПЕРСОНАЛУ:"
+            yield "-" * 40
             for change in adv_data.get('personnel_changes', []):
-                details.append(f"   📌 Пункт {change.get('point_number', 'н/д')}: {change.get('type', 'н/д')}")
+                yield f"   📌 Пункт {change.get('point_number', 'н/д')}: {change.get('type', 'н/д')}"
                 for person in change.get('personnel_data', []):
-                    details.append(f"      👤 {person.get('full_name', 'н/д')}")
-                    details.append(f"         🎖️  Звання: {person.get('rank', 'н/д')}")
-                    details.append(f"         💼 Посада: {person.get('position', 'н/д')}")
+                    yield f"      👤 {person.get('full_name', 'н/д')}"
+                    yield f"         🎖️  Звання: {person.get('rank', 'н/д')}"
+                    yield f"         💼 Посада: {person.get('position', 'н/д')}"
                     if person.get('enrollment_date'):
-                        details.append(f"         📅 Дата зарахування: {person.get('enrollment_date')}")
+                        yield f"         📅 Дата зарахування: {person.get('enrollment_date')}"
                     if person.get('salary'):
-                        details.append(f"         💰 Оклад: {person.get('salary')} грн")
-                details.append("")
+                        yield f"         💰 Оклад: {person.get('salary')} грн"
+                yield ""
             
-            details.append("💰 ФІНАНСОВІ ОПЕРАЦІЇ:")
-            details.append("-" * 40)
+            yield "💰 ФІНАНСОВІ ОПЕРАЦІЇ:"
+            yield "-" * 40
             for op in adv_data.get('financial_operations', []):
-                details.append(f"   💰 {op.get('description', 'н/д')}")
+                yield f"   💰 {op.get('description', 'н/д')}"
             if not adv_data.get('financial_operations'):
-                details.append("   📝 Фінансових операцій не виявлено")
-            details.append("")
-        
-        return '\n'.join(details)
+                yield "   📝 Фінансових операцій не виявлено"
+            yield ""
     
     def update_stats(self):
-        """Оновлення статистики"""
-        if not self.orders_data:
+        """Оновлення статистики з накопиченого агрегату (без перегляду всіх результатів)"""
+        stats = self.results.stats
+        if not stats.total_orders:
             stats_text = [
                 "📊 СТАТИСТИКА СИСТЕМИ",
                 "=" * 50,
@@ -425,31 +670,29 @@ class ModernOrderAnalyzerApp:
                 "   кнопку '🔍 ПОЧАТИ АНАЛІЗ'"
             ]
         else:
-            total_files = len(self.orders_data)
-            successful_files = len([o for o in self.orders_data if 'error' not in o])
-            total_personnel = sum(len(o.get('personnel', [])) for o in self.orders_data if 'error' not in o)
-            
             stats_text = [
                 "📊 СТАТИСТИКА АНАЛІЗУ",
                 "=" * 50,
-                f"📁 Загальна кількість файлів: {total_files}",
-                f"✅ Успішно оброблено: {successful_files}",
-                f"❌ З помилками: {total_files - successful_files}",
-                f"👥 Всього змін персоналу: {total_personnel}",
-                "",
-                "📈 РОЗПОДІЛ ЗА ТИПАМИ:",
-                "-" * 30
+                f"📁 Загальна кількість файлів: {stats.total_orders}",
+                f"✅ Успішно оброблено: {stats.successful_orders}",
+                f"❌ З помилками: {stats.failed_orders}",
+                f"👥 Всього змін персоналу: {stats.total_personnel}",
             ]
             
-            # Статистика за типами
-            order_types = {}
-            for order in self.orders_data:
-                if 'error' not in order:
-                    order_type = order.get('type', 'невідомо')
-                    order_types[order_type] = order_types.get(order_type, 0) + 1
-            
-            for otype, count in order_types.items():
-                stats_text.append(f"   {otype}: {count}")
+            distributions = (
+                ("📈 РОЗПОДІЛ ЗА ТИПАМИ:", stats.order_types),
+                ("📌 РОЗПОДІЛ ЗА ДІЯМИ:", stats.actions),
+                ("🎖️ РОЗПОДІЛ ЗА ЗВАННЯМИ:", stats.ranks),
+                ("🏢 РОЗПОДІЛ ЗА ВІЙСЬКОВИМИ ЧАСТИНАМИ:", stats.units)
+            )
+            for title, counter in distributions:
+                if not counter:
+                    continue
+                stats_text += ["", title, "-" * 30]
+                for name, count in counter.most_common(STATS_TOP_ITEMS):
+                    stats_text.append(f"   {name}: {count}")
+                if len(counter) > STATS_TOP_ITEMS:
+                    stats_text.append(f"   ... ще {len(counter) - STATS_TOP_ITEMS}")
         
         self.stats_text.delete(1.0, tk.END)
         self.stats_text.insert(1.0, '\n'.join(stats_text))
@@ -465,15 +708,21 @@ class ModernOrderAnalyzerApp:
             file_types = {
                 'html': [("HTML файли", "*.html")],
                 'json': [("JSON файли", "*.json")],
+                'ndjson': [("NDJSON файли", "*.ndjson")],
                 'csv': [("CSV файли", "*.csv")],
-                'excel': [("Excel файли", "*.xlsx")]
+                'excel': [("Excel файли", "*.xlsx")],
+                'sqlite': [("База SQLite", "*.sqlite")],
+                'parquet': [("Папка Parquet", "*.parquet")]
             }
             
             default_ext = {
                 'html': '.html',
                 'json': '.json', 
+                'ndjson': '.ndjson',
                 'csv': '.csv',
-                'excel': '.xlsx'
+                'excel': '.xlsx',
+                'sqlite': '.sqlite',
+                'parquet': '.parquet'
             }
             
             # Діалог збереження
@@ -487,7 +736,8 @@ class ModernOrderAnalyzerApp:
                 self.status_var.set(f"📤 Експорт у {format_type.upper()}...")
                 
                 # Виконуємо експорт
-                self.exporter.export_data(self.orders_data, file_path, format_type)
+                self.exporter.export_data(self.orders_data, file_path, format_type,
+                                          stats=self.results.stats)
                 
                 self.status_var.set(f"✅ Експорт завершено: {os.path.basename(file_path)}")
                 
@@ -518,4 +768,6 @@ def main():
                            f"Переконайтесь, що всі необхідні файли знаходяться в одній папці.")
 
 if __name__ == "__main__":
+    # Потрібно для пулу процесів у зібраному EXE
+    multiprocessing.freeze_support()
     main()
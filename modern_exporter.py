@@ -1,12 +1,150 @@
 import json
 import csv
-import pandas as pd
 from datetime import datetime
-from typing import List, Dict
+from html import escape
+from typing import Dict, Iterable, Iterator, List, Optional
 import os
 from pathlib import Path
 
+from stats_aggregate import StatsAggregate
+
+# Максимум рядків на аркуші Excel (разом із заголовком)
+EXCEL_MAX_ROWS = 1048576
+
+# Найоб'ємніші поля результату; режим slim їх не експортує
+HEAVY_FIELDS = ('raw_text', 'advanced_data')
+
+
+def strip_heavy_fields(record: Dict) -> Dict:
+    """Копія запису без raw_text та advanced_data"""
+    return {key: value for key, value in record.items() if key not in HEAVY_FIELDS}
+
+
+# Скрипт HTML звіту: таблиці малюються з JSON-блоку report-data посторінково,
+# клік по заголовку колонки сортує таблицю (повторний — у зворотному порядку)
+REPORT_SCRIPT = r"""
+(function () {
+    const data = JSON.parse(document.getElementById('report-data').textContent);
+
+    function cellText(value) {
+        return value === null || value === undefined || value === '' ? 'н/д' : String(value);
+    }
+
+    function compare(a, b) {
+        if (typeof a === 'number' && typeof b === 'number') return a - b;
+        return cellText(a).localeCompare(cellText(b), 'uk', {numeric: true});
+    }
+
+    document.querySelectorAll('table[data-table]').forEach(function (table) {
+        const key = table.dataset.table;
+        const rows = data[key] || [];
+        const statusColumn = Number(table.dataset.statusColumn);
+        const headers = Array.from(table.tHead.rows[0].cells);
+        const tbody = table.tBodies[0];
+        const pager = document.querySelector('.pager[data-table="' + key + '"]');
+        const info = pager.querySelector('.pager-info');
+        let view = rows;
+        let page = 0;
+        let sortColumn = -1;
+        let ascending = true;
+
+        function render() {
+            const pages = Math.max(1, Math.ceil(view.length / PAGE_SIZE));
+            page = Math.max(0, Math.min(page, pages - 1));
+            const fragment = document.createDocumentFragment();
+
+            if (!view.length) {
+                const tr = document.createElement('tr');
+                const td = document.createElement('td');
+                td.colSpan = headers.length;
+                td.style.textAlign = 'center';
+                td.textContent = table.dataset.empty;
+                tr.appendChild(td);
+                fragment.appendChild(tr);
+            }
+
+            view.slice(page * PAGE_SIZE, (page + 1) * PAGE_SIZE).forEach(function (row) {
+                const tr = document.createElement('tr');
+                row.forEach(function (value, column) {
+                    const td = document.createElement('td');
+                    if (column === statusColumn) {
+                        const badge = document.createElement('span');
+                        badge.className = 'badge ' + (value === 'OK' ? 'badge-success' : 'badge-error');
+                        badge.textContent = value;
+                        td.appendChild(badge);
+                    } else {
+                        td.textContent = cellText(value);
+                    }
+                    tr.appendChild(td);
+                });
+                fragment.appendChild(tr);
+            });
+
+            tbody.replaceChildren(fragment);
+            info.textContent = 'Сторінка ' + (page + 1) + ' з ' + pages + ' · записів: ' + view.length;
+        }
+
+        headers.forEach(function (th, column) {
+            th.addEventListener('click', function () {
+                ascending = sortColumn === column ? !ascending : true;
+                sortColumn = column;
+                view = rows.slice().sort(function (a, b) {
+                    const result = compare(a[column], b[column]);
+                    return ascending ? result : -result;
+                });
+                headers.forEach(function (other) { other.classList.remove('sorted-asc', 'sorted-desc'); });
+                th.classList.add(ascending ? 'sorted-asc' : 'sorted-desc');
+                page = 0;
+                render();
+            });
+        });
+
+        pager.querySelector('.pager-prev').addEventListener('click', function () { page--; render(); });
+        pager.querySelector('.pager-next').addEventListener('click', function () { page++; render(); });
+        render();
+    });
+
+    // Проста навігація по вкладках
+    document.querySelectorAll('.nav-tabs a').forEach(function (link) {
+        link.addEventListener('click', function (e) {
+            e.preventDefault();
+            const targetId = this.getAttribute('href').substring(1);
+            document.querySelectorAll('.section').forEach(function (section) {
+                section.style.display = 'none';
+            });
+            document.getElementById(targetId).style.display = 'block';
+        });
+    });
+})();
+"""
+
 class ModernExporter:
+    # Таблиці HTML звіту: (ключ у даних, заголовок, колонки, текст для порожньої таблиці)
+    REPORT_TABLES = [
+        ('summary', '📋 Зведена інформація',
+         ['Файл', 'Тип', 'Номер', 'Дата', 'Персонал', 'Статус'], 'Немає даних'),
+        ('personnel', '👥 Зміни персоналу',
+         ['Номер наказу', 'ПІБ', 'Звання', 'Посада', 'Дія'], 'Немає даних'),
+        ('financial', '💰 Фінансові операції',
+         ['Номер наказу', 'Тип операції', 'Опис', 'Сума/Відсоток'], 'Немає фінансових операцій'),
+        ('documents', '📄 Операції з документами',
+         ['Номер наказу', 'Тип операції', 'Опис', 'Тривалість'], 'Немає операцій з документами'),
+    ]
+
+    # Назви аркушів Excel для таблиць звіту
+    EXCEL_SHEETS = {
+        'summary': 'Зведення',
+        'personnel': 'Персонал',
+        'financial': 'Фінанси',
+        'documents': 'Документи',
+    }
+
+    # Рядків на сторінці таблиці у HTML звіті
+    HTML_PAGE_SIZE = 100
+
+    # Скільки записів серіалізується перед одним записом у файл
+    WRITE_CHUNK = 1000
+
     def __init__(self):
         self.styles = {
             'html_css': '''
@@ -139,6 +277,27 @@ class ModernExporter:
                         from { opacity: 0; transform: translateY(20px); }
                         to { opacity: 1; transform: translateY(0); }
                     }
+                    table[data-table] th {
+                        cursor: pointer;
+                        user-select: none;
+                    }
+                    th.sorted-asc::after { content: ' ▲'; }
+                    th.sorted-desc::after { content: ' ▼'; }
+                    .pager {
+                        display: flex;
+                        align-items: center;
+                        justify-content: center;
+                        gap: 15px;
+                        color: #7f8c8d;
+                    }
+                    .pager button {
+                        background: #3498db;
+                        color: white;
+                        border: none;
+                        border-radius: 5px;
+                        padding: 8px 15px;
+                        cursor: pointer;
+                    }
                     .export-info {
                         background: #f8f9fa;
                         padding: 20px;
@@ -151,117 +310,158 @@ class ModernExporter:
             'json_indent': 2
         }
 
-    def export_data(self, orders_data: List[Dict], output_path: str, format_type: str = 'html'):
-        """Універсальний експорт даних у різних форматах"""
+    def export_data(self, orders_data: List[Dict], output_path: str, format_type: str = 'html',
+                    compact: bool = False, slim: bool = False, stats: Optional[StatsAggregate] = None):
+        """Універсальний експорт даних у різних форматах.
+
+        compact — JSON без відступів; slim — JSON/NDJSON без raw_text та advanced_data;
+        stats — вже накопичена статистика цих даних (ResultsStore.stats), без неї
+        статистика для звіту рахується з orders_data.
+        """
         try:
             if format_type == 'html':
-                self._export_html(orders_data, output_path)
+                self._export_html(orders_data, output_path, stats)
             elif format_type == 'json':
-                self._export_json(orders_data, output_path)
+                self._export_json(orders_data, output_path, compact, slim)
+            elif format_type == 'ndjson':
+                self._export_ndjson(orders_data, output_path, slim)
             elif format_type == 'csv':
                 self._export_csv(orders_data, output_path)
             elif format_type == 'excel':
                 self._export_excel(orders_data, output_path)
+            elif format_type == 'sqlite':
+                self._export_sqlite(orders_data, output_path)
+            elif format_type == 'parquet':
+                self._export_parquet(orders_data, output_path)
             else:
                 raise ValueError(f"Непідтримуваний формат: {format_type}")
         except Exception as e:
             raise Exception(f"Помилка експорту: {str(e)}")
 
-    def _export_html(self, orders_data: List[Dict], output_path: str):
-        """Експорт у стильний HTML з інтерактивним інтерфейсом"""
-        html_content = self._generate_html_report(orders_data)
-        
+    def _export_html(self, orders_data: List[Dict], output_path: str,
+                     stats: Optional[StatsAggregate] = None):
+        """Експорт у стильний HTML з інтерактивним інтерфейсом.
+
+        Звіт пишеться у файл частинами: розмітка сторінки, далі дані всіх
+        таблиць одним компактним JSON-блоком (рядки — масиви значень), далі
+        скрипт, що малює таблиці в браузері посторінково з сортуванням за
+        колонками. HTML-рядок для кожного запису не формується.
+        """
+        if stats is None:
+            stats = StatsAggregate.from_records(orders_data)
+
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            f.write(self._html_head())
+            f.write(self._generate_stats_section(stats))
+            for key, title, columns, empty_text in self.REPORT_TABLES:
+                f.write(self._html_table_section(key, title, columns, empty_text))
+            f.write('</div></div>\n')
 
-    def _generate_html_report(self, orders_data: List[Dict]) -> str:
-        """Генерація HTML звіту"""
-        
-        # Статистика
-        stats = self._calculate_stats(orders_data)
-        
-        html = f'''
-        <!DOCTYPE html>
-        <html lang="uk">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Аналіз наказів ЗСУ</title>
-            {self.styles['html_css']}
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>📊 Аналіз наказів ЗСУ</h1>
-                    <div class="subtitle">
-                        Звіт створено {datetime.now().strftime('%d.%m.%Y о %H:%M')}
-                    </div>
-                </div>
+            # Дані таблиць: '<' екранується, щоб текст документів не закрив тег script
+            f.write('<script type="application/json" id="report-data">{')
+            for index, (key, *_) in enumerate(self.REPORT_TABLES):
+                if index:
+                    f.write(',')
+                f.write(f'"{key}":[')
+                self._write_json_items(f, self._report_rows(key, orders_data), escape_html=True)
+                f.write(']')
+            f.write('}</script>\n')
 
-                <ul class="nav-tabs">
-                    <li><a href="#stats">Статистика</a></li>
-                    <li><a href="#summary">Зведення</a></li>
-                    <li><a href="#personnel">Персонал</a></li>
-                    <li><a href="#financial">Фінанси</a></li>
-                    <li><a href="#documents">Документи</a></li>
-                </ul>
-
-                <div class="tab-content">
-                    {self._generate_stats_section(stats)}
-                    {self._generate_summary_section(orders_data)}
-                    {self._generate_personnel_section(orders_data)}
-                    {self._generate_financial_section(orders_data)}
-                    {self._generate_documents_section(orders_data)}
-                </div>
+            f.write(f'<script>const PAGE_SIZE = {self.HTML_PAGE_SIZE};\n{REPORT_SCRIPT}</script>\n')
+            f.write('</body>\n</html>\n')
+
+    def _html_head(self) -> str:
+        return f'''<!DOCTYPE html>
+<html lang="uk">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Аналіз наказів ЗСУ</title>
+    {self.styles['html_css']}
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>📊 Аналіз наказів ЗСУ</h1>
+            <div class="subtitle">
+                Звіт створено {datetime.now().strftime('%d.%m.%Y о %H:%M')}
             </div>
+        </div>
 
-            <script>
-                // Проста навігація по вкладках
-                document.querySelectorAll('.nav-tabs a').forEach(link => {{
-                    link.addEventListener('click', function(e) {{
-                        e.preventDefault();
-                        const targetId = this.getAttribute('href').substring(1);
-                        document.querySelectorAll('.section').forEach(section => {{
-                            section.style.display = 'none';
-                        }});
-                        document.getElementById(targetId).style.display = 'block';
-                    }});
-                }});
-
-                // Показуємо першу вкладку за замовчуванням
-                document.getElementById('stats').style.display = 'block';
-            </script>
-        </body>
-        </html>
-        '''
-        
-        return html
+        <ul class="nav-tabs">
+            <li><a href="#stats">Статистика</a></li>
+            <li><a href="#summary">Зведення</a></li>
+            <li><a href="#personnel">Персонал</a></li>
+            <li><a href="#financial">Фінанси</a></li>
+            <li><a href="#documents">Документи</a></li>
+        </ul>
 
-    def _calculate_stats(self, orders_data: List[Dict]) -> Dict:
-        """Розрахунок статистики"""
-        total_orders = len(orders_data)
-        successful_orders = len([o for o in orders_data if 'error' not in o])
-        total_personnel = sum(len(o.get('personnel', [])) for o in orders_data if 'error' not in o)
-        
-        order_types = {}
-        for order in orders_data:
-            if 'error' not in order:
-                order_type = order.get('type', 'невідомо')
-                order_types[order_type] = order_types.get(order_type, 0) + 1
-        
-        return {
-            'total_orders': total_orders,
-            'successful_orders': successful_orders,
-            'failed_orders': total_orders - successful_orders,
-            'total_personnel': total_personnel,
-            'order_types': order_types
-        }
+        <div class="tab-content">
+'''
+
+    def _html_table_section(self, key: str, title: str, columns: List[str], empty_text: str) -> str:
+        """Порожня таблиця з пагінацією; рядки малює скрипт звіту"""
+        headers = ''.join(f'<th>{escape(column)}</th>' for column in columns)
+        status_column = columns.index('Статус') if 'Статус' in columns else -1
+        return f'''
+        <div id="{key}" class="section" style="display: none;">
+            <h2>{title}</h2>
+            <table data-table="{key}" data-empty="{escape(empty_text)}" data-status-column="{status_column}">
+                <thead><tr>{headers}</tr></thead>
+                <tbody></tbody>
+            </table>
+            <div class="pager" data-table="{key}">
+                <button class="pager-prev">◀ Назад</button>
+                <span class="pager-info"></span>
+                <button class="pager-next">Вперед ▶</button>
+            </div>
+        </div>
+'''
+
+    def _report_rows(self, key: str, orders_data: List[Dict]) -> Iterator[list]:
+        """Рядки таблиці звіту (значення по колонках REPORT_TABLES)"""
+        if key == 'summary':
+            for order in orders_data:
+                yield [order.get('file_name'), order.get('type', 'невідомо'), order.get('number'),
+                       order.get('date'), len(order.get('personnel', [])),
+                       'OK' if 'error' not in order else 'Помилка']
+        elif key == 'personnel':
+            for order in orders_data:
+                if 'error' not in order:
+                    for person in order.get('personnel', []):
+                        yield [order.get('number'), person.get('full_name'), person.get('rank'),
+                               person.get('position'), person.get('action')]
+        else:
+            operations, last_field = (('financial_operations', 'amount') if key == 'financial'
+                                      else ('document_operations', 'duration'))
+            for order in orders_data:
+                if 'error' not in order and 'advanced_data' in order:
+                    for op in order['advanced_data'].get(operations, []):
+                        yield [order.get('number'), op.get('type'), op.get('description'), op.get(last_field)]
+
+    def _write_json_items(self, f, items: Iterable, indent: Optional[int] = None,
+                          escape_html: bool = False, separator: str = ','):
+        """Запис елементів JSON-масиву (без дужок) частинами, без побудови всього масиву в пам'яті"""
+        item_separators = (',', ':') if indent is None else (',', ': ')
+        chunk = []
+        first = True
+        for item in items:
+            text = json.dumps(item, ensure_ascii=False, indent=indent, separators=item_separators, default=str)
+            if escape_html:
+                text = text.replace('<', '\\u003c')
+            chunk.append(text)
+            if len(chunk) >= self.WRITE_CHUNK:
+                f.write(('' if first else separator) + separator.join(chunk))
+                first = False
+                chunk = []
+        if chunk:
+            f.write(('' if first else separator) + separator.join(chunk))
 
-    def _generate_stats_section(self, stats: Dict) -> str:
+    def _generate_stats_section(self, stats: StatsAggregate) -> str:
         """Генерація секції статистики"""
         order_types_html = ''.join(
-            f'<div class="stat-card"><div class="stat-number">{count}</div><div class="stat-label">{otype}</div></div>'
-            for otype, count in stats['order_types'].items()
+            f'<div class="stat-card"><div class="stat-number">{count}</div><div class="stat-label">{escape(str(otype))}</div></div>'
+            for otype, count in stats.order_types.most_common()
         )
         
         return f'''
@@ -270,19 +470,19 @@ class ModernExporter:
             
             <div class="stats-grid">
                 <div class="stat-card">
-                    <div class="stat-number">{stats['total_orders']}</div>
+                    <div class="stat-number">{stats.total_orders}</div>
                     <div class="stat-label">Всього документів</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-number">{stats['successful_orders']}</div>
+                    <div class="stat-number">{stats.successful_orders}</div>
                     <div class="stat-label">Успішно оброблено</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-number">{stats['failed_orders']}</div>
+                    <div class="stat-number">{stats.failed_orders}</div>
                     <div class="stat-label">З помилками</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-number">{stats['total_personnel']}</div>
+                    <div class="stat-number">{stats.total_personnel}</div>
                     <div class="stat-label">Змін персоналу</div>
                 </div>
             </div>
@@ -294,162 +494,40 @@ class ModernExporter:
         </div>
         '''
 
-    def _generate_summary_section(self, orders_data: List[Dict]) -> str:
-        """Генерація секції зведення"""
-        rows = []
-        for order in orders_data:
-            status_badge = '<span class="badge badge-success">OK</span>' if 'error' not in order else '<span class="badge badge-error">Помилка</span>'
-            personnel_count = len(order.get('personnel', []))
-            
-            rows.append(f'''
-            <tr>
-                <td>{order.get('file_name', 'н/д')}</td>
-                <td>{order.get('type', 'невідомо')}</td>
-                <td>{order.get('number', 'н/д')}</td>
-                <td>{order.get('date', 'н/д')}</td>
-                <td>{personnel_count}</td>
-                <td>{status_badge}</td>
-            </tr>
-            ''')
-        
-        return f'''
-        <div id="summary" class="section" style="display: none;">
-            <h2>📋 Зведена інформація</h2>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Файл</th>
-                        <th>Тип</th>
-                        <th>Номер</th>
-                        <th>Дата</th>
-                        <th>Персонал</th>
-                        <th>Статус</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {''.join(rows)}
-                </tbody>
-            </table>
-        </div>
-        '''
-
-    def _generate_personnel_section(self, orders_data: List[Dict]) -> str:
-        """Генерація секції персоналу"""
-        rows = []
-        for order in orders_data:
-            if 'error' not in order:
-                for person in order.get('personnel', []):
-                    rows.append(f'''
-                    <tr>
-                        <td>{order.get('number', 'н/д')}</td>
-                        <td>{person.get('full_name', 'н/д')}</td>
-                        <td>{person.get('rank', 'н/д')}</td>
-                        <td>{person.get('position', 'н/д')}</td>
-                        <td>{person.get('action', 'н/д')}</td>
-                    </tr>
-                    ''')
-        
-        return f'''
-        <div id="personnel" class="section" style="display: none;">
-            <h2>👥 Зміни персоналу</h2>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Номер наказу</th>
-                        <th>ПІБ</th>
-                        <th>Звання</th>
-                        <th>Посада</th>
-                        <th>Дія</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {''.join(rows) if rows else '<tr><td colspan="5" style="text-align: center;">Немає даних</td></tr>'}
-                </tbody>
-            </table>
-        </div>
-        '''
-
-    def _generate_financial_section(self, orders_data: List[Dict]) -> str:
-        """Генерація фінансової секції"""
-        rows = []
-        for order in orders_data:
-            if 'error' not in order and 'advanced_data' in order:
-                for op in order['advanced_data'].get('financial_operations', []):
-                    rows.append(f'''
-                    <tr>
-                        <td>{order.get('number', 'н/д')}</td>
-                        <td>{op.get('type', 'н/д')}</td>
-                        <td>{op.get('description', 'н/д')}</td>
-                        <td>{op.get('amount', 'н/д')}</td>
-                    </tr>
-                    ''')
-        
-        return f'''
-        <div id="financial" class="section" style="display: none;">
-            <h2>💰 Фінансові операції</h2>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Номер наказу</th>
-                        <th>Тип операції</th>
-                        <th>Опис</th>
-                        <th>Сума/Відсоток</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {''.join(rows) if rows else '<tr><td colspan="4" style="text-align: center;">Немає фінансових операцій</td></tr>'}
-                </tbody>
-            </table>
-        </div>
-        '''
-
-    def _generate_documents_section(self, orders_data: List[Dict]) -> str:
-        """Генерація секції документів"""
-        rows = []
-        for order in orders_data:
-            if 'error' not in order and 'advanced_data' in order:
-                for op in order['advanced_data'].get('document_operations', []):
-                    rows.append(f'''
-                    <tr>
-                        <td>{order.get('number', 'н/д')}</td>
-                        <td>{op.get('type', 'н/д')}</td>
-                        <td>{op.get('description', 'н/д')}</td>
-                        <td>{op.get('duration', 'н/д')}</td>
-                    </tr>
-                    ''')
-        
-        return f'''
-        <div id="documents" class="section" style="display: none;">
-            <h2>📄 Операції з документами</h2>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Номер наказу</th>
-                        <th>Тип операції</th>
-                        <th>Опис</th>
-                        <th>Тривалість</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {''.join(rows) if rows else '<tr><td colspan="4" style="text-align: center;">Немає операцій з документами</td></tr>'}
-                </tbody>
-            </table>
-        </div>
-        '''
+    def _export_json(self, orders_data: List[Dict], output_path: str,
+                     compact: bool = False, slim: bool = False):
+        """Експорт у структурований JSON.
 
-    def _export_json(self, orders_data: List[Dict], output_path: str):
-        """Експорт у структурований JSON"""
-        export_data = {
-            'metadata': {
-                'export_date': datetime.now().isoformat(),
-                'total_documents': len(orders_data),
-                'version': '1.0'
-            },
-            'orders': orders_data
+        Документи пишуться у масив orders по одному, без побудови всього
+        JSON у пам'яті; структура файлу та сама, що й раніше.
+        """
+        metadata = {
+            'export_date': datetime.now().isoformat(),
+            'total_documents': len(orders_data),
+            'version': '1.0'
         }
+        orders = (strip_heavy_fields(order) for order in orders_data) if slim else orders_data
+        indent = None if compact else self.styles['json_indent']
         
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, ensure_ascii=False, indent=self.styles['json_indent'])
+            if compact:
+                f.write('{"metadata":' + json.dumps(metadata, ensure_ascii=False, separators=(',', ':'))
+                        + ',"orders":[')
+                self._write_json_items(f, orders)
+                f.write(']}')
+            else:
+                f.write('{\n"metadata": ' + json.dumps(metadata, ensure_ascii=False, indent=indent)
+                        + ',\n"orders": [\n')
+                self._write_json_items(f, orders, indent=indent, separator=',\n')
+                f.write('\n]\n}\n')
+
+    def _export_ndjson(self, orders_data: List[Dict], output_path: str, slim: bool = False):
+        """Експорт у NDJSON: один документ — один рядок компактного JSON"""
+        orders = (strip_heavy_fields(order) for order in orders_data) if slim else orders_data
+        with open(output_path, 'w', encoding='utf-8') as f:
+            self._write_json_items(f, orders, separator='\n')
+            if orders_data:
+                f.write('\n')
 
     def _export_csv(self, orders_data: List[Dict], output_path: str):
         """Експорт у CSV з розділенням по типам даних"""
@@ -487,6 +565,26 @@ class ModernExporter:
         
         self._write_csv(personnel_data, csv_dir / 'personnel.csv')
 
+    def _export_sqlite(self, orders_data: List[Dict], output_path: str):
+        """Експорт у базу SQLite: документи дописуються або оновлюються за хешем файлу"""
+        from sqlite_export import SqliteExporter
+        
+        exporter = SqliteExporter(output_path)
+        try:
+            exporter.upsert_all(orders_data)
+        finally:
+            exporter.close()
+
+    def _export_parquet(self, orders_data: List[Dict], output_path: str):
+        """Експорт у Parquet: папка з файлами orders, personnel, financial, documents, structural"""
+        try:
+            from parquet_export import write_parquet_tables
+        except ImportError:
+            raise ImportError("Для експорту в Parquet встановіть: pip install pyarrow")
+        
+        # Як і для CSV, таблиці пишуться в папку з назвою файлу
+        write_parquet_tables(orders_data, Path(output_path).with_suffix(''))
+
     def _write_csv(self, data: List[Dict], file_path: Path):
         """Запис даних у CSV файл"""
         if data:
@@ -496,20 +594,51 @@ class ModernExporter:
                 writer.writerows(data)
 
     def _export_excel(self, orders_data: List[Dict], output_path: str):
-        """Мінімалістичний експорт в Excel (для тих, хто все ще хоче Excel)"""
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-            # Тільки основні дані
-            summary_data = []
-            for order in orders_data:
-                summary_data.append({
-                    'Файл': order.get('file_name', 'н/д'),
-                    'Тип': order.get('type', 'невідомо'),
-                    'Номер': order.get('number', 'н/д'),
-                    'Дата': order.get('date', 'н/д'),
-                    'Кількість осіб': len(order.get('personnel', [])),
-                    'Статус': 'OK' if 'error' not in order else 'Помилка'
-                })
-            
-            if summary_data:
-                df = pd.DataFrame(summary_data)
-                df.to_excel(writer, sheet_name='Зведення', index=False)
\ No newline at end of file
+        """Експорт в Excel: окремі аркуші зведення, персоналу, фінансових операцій та документів.
+
+        Книга створюється у write-only режимі openpyxl: рядки пишуться у файл
+        потоково, без моделі всієї книги в пам'яті. Коли аркуш досягає
+        граничної кількості рядків Excel, продовження йде на аркуш
+        «Назва (2)» з тим самим заголовком.
+        """
+        from openpyxl import Workbook
+        from openpyxl.styles import Font
+
+        workbook = Workbook(write_only=True)
+        header_font = Font(bold=True)
+
+        for key, _, columns, _ in self.REPORT_TABLES:
+            sheet_name = self.EXCEL_SHEETS[key]
+            part = 1
+            sheet = None
+            rows_in_sheet = 0
+            for row in self._report_rows(key, orders_data):
+                if sheet is None or rows_in_sheet >= EXCEL_MAX_ROWS:
+                    sheet = self._new_excel_sheet(workbook, sheet_name if part == 1 else f'{sheet_name} ({part})',
+                                                  columns, header_font)
+                    part += 1
+                    rows_in_sheet = 1
+                sheet.append(row)
+                rows_in_sheet += 1
+            if sheet is None:
+                self._new_excel_sheet(workbook, sheet_name, columns, header_font)
+
+        workbook.save(output_path)
+
+    def _new_excel_sheet(self, workbook, title: str, columns: List[str], header_font):
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.utils import get_column_letter
+
+        sheet = workbook.create_sheet(title)
+        # Ширину колонок у write-only режимі задаємо до запису рядків
+        for index, column in enumerate(columns, start=1):
+            sheet.column_dimensions[get_column_letter(index)].width = max(14, len(column) + 4)
+        sheet.freeze_panes = 'A2'
+
+        header = []
+        for column in columns:
+            cell = WriteOnlyCell(sheet, value=column)
+            cell.font = header_font
+            header.append(cell)
+        sheet.append(header)
+        return sheet
@@ -0,0 +1,154 @@
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import List, Optional
+
+import pytesseract
+from PIL import Image
+
+# Конфігурація tesseract для українських наказів
+OCR_CONFIG = r'--oem 3 --psm 6 -l ukr+eng'
+
+# Зображення, вищі за півтори смуги, розпізнаються смугами паралельно
+DEFAULT_BAND_HEIGHT = 1200
+DEFAULT_BAND_OVERLAP = 60
+
+# Скільки рядків на стику смуг порівнюється для видалення дублікатів
+MAX_STITCH_LINES = 4
+
+
+# Спільний для всіх процесів програми семафор одночасних запусків tesseract
+# (multiprocessing.BoundedSemaphore; None — без обмеження)
+_ocr_slots = None
+
+
+def _init_ocr_slots(slots):
+    """Ініціалізатор процесу OCR: підключення спільного обмеження одночасних розпізнавань"""
+    global _ocr_slots
+    _ocr_slots = slots
+
+
+def _recognize(image: Image.Image, config: str) -> str:
+    """Задача для процесу OCR: розпізнавання одного зображення чи смуги"""
+    with _ocr_slots if _ocr_slots is not None else nullcontext():
+        return pytesseract.image_to_string(image, config=config)
+
+
+def image_digest(image: Image.Image) -> str:
+    """SHA-256 декодованих пікселів зображення разом з режимом та розміром"""
+    digest = hashlib.sha256(f"{image.mode}:{image.size[0]}x{image.size[1]}:".encode('ascii'))
+    digest.update(image.tobytes())
+    return digest.hexdigest()
+
+
+def tesseract_version() -> str:
+    try:
+        return str(pytesseract.get_tesseract_version())
+    except Exception:
+        return 'unknown'
+
+
+def split_bands(image: Image.Image, band_height: int = DEFAULT_BAND_HEIGHT,
+                overlap: int = DEFAULT_BAND_OVERLAP) -> List[Image.Image]:
+    """Розрізання високого зображення на горизонтальні смуги з перекриттям.
+
+    Межа смуги ставиться на найсвітліший рядок пікселів поблизу цільової
+    висоти, тобто зазвичай між рядками тексту, а перекриття страхує рядки,
+    які все ж потрапили на межу.
+    """
+    width, height = image.size
+    if height <= band_height * 1.5:
+        return [image]
+
+    # Середня яскравість кожного рядка пікселів (зменшення до ширини 1)
+    profile = list(image.convert('L').resize((1, height), Image.BOX).getdata())
+    search = band_height // 8
+
+    cuts = [0]
+    while height - cuts[-1] > band_height * 1.5:
+        target = cuts[-1] + band_height
+        cuts.append(max(range(target - search, target + search), key=lambda y: profile[y]))
+    cuts.append(height)
+
+    return [image.crop((0, max(0, top - overlap), width, min(height, bottom + overlap)))
+            for top, bottom in zip(cuts, cuts[1:])]
+
+
+def stitch_bands(texts: List[str]) -> str:
+    """Склеювання тексту смуг по порядку з видаленням рядків, повторених у перекритті"""
+    lines: List[str] = []
+    for text in texts:
+        band_lines = [line for line in text.splitlines() if line.strip()]
+        skip = _overlap_length(lines, band_lines)
+        lines.extend(band_lines[skip:])
+    return '\n'.join(lines)
+
+
+def _normalize(line: str) -> str:
+    return ' '.join(line.split()).lower()
+
+
+def _overlap_length(previous: List[str], current: List[str]) -> int:
+    for size in range(min(MAX_STITCH_LINES, len(previous), len(current)), 0, -1):
+        if [_normalize(line) for line in previous[-size:]] == [_normalize(line) for line in current[:size]]:
+            return size
+    return 0
+
+
+class OcrPipeline:
+    """Етап OCR з власним пулом процесів, окремим від пулу розбору тексту.
+
+    Пул за замовчуванням має стільки процесів, скільки ядер, тож один великий
+    скан розпізнається смугами на всіх ядрах. Коли пулів кілька (по одному в
+    кожному процесі розбору), slots — спільний семафор на кількість ядер:
+    процеси створюються лише під час розпізнавання, а одночасно працює не
+    більше tesseract, ніж ядер.
+    """
+
+    def __init__(self, workers: Optional[int] = None, config: str = OCR_CONFIG,
+                 band_height: int = DEFAULT_BAND_HEIGHT, overlap: int = DEFAULT_BAND_OVERLAP,
+                 slots=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.config = config
+        self.band_height = band_height
+        self.overlap = overlap
+        self.slots = slots
+        # Послідовне розпізнавання в цьому процесі теж займає спільні слоти
+        _init_ocr_slots(slots)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def settings(self) -> str:
+        """Усе, від чого залежить розпізнаний текст (для ключа кешу OCR)"""
+        return f"tesseract={tesseract_version()};config={self.config};bands={self.band_height}/{self.overlap}"
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_ocr_slots,
+                                                 initargs=(self.slots,))
+        return self._executor
+
+    def recognize(self, image: Image.Image) -> str:
+        """Розпізнавання зображення; великі зображення — смугами паралельно"""
+        bands = split_bands(image, self.band_height, self.overlap)
+        if len(bands) == 1 or self.workers <= 1:
+            return stitch_bands([_recognize(band, self.config) for band in bands])
+        return stitch_bands(list(self._pool().map(_recognize, bands, [self.config] * len(bands))))
+
+    def recognize_many(self, images: List[Image.Image]) -> List[str]:
+        """Паралельне розпізнавання кількох зображень (результати у вихідному порядку).
+
+        Смуги всіх зображень подаються в пул разом, тож результат для кожного
+        зображення той самий, що й від recognize().
+        """
+        if self.workers <= 1 or len(images) <= 1:
+            return [self.recognize(image) for image in images]
+        bands = [split_bands(image, self.band_height, self.overlap) for image in images]
+        flat = [band for image_bands in bands for band in image_bands]
+        texts = iter(self._pool().map(_recognize, flat, [self.config] * len(flat)))
+        return [stitch_bands([next(texts) for _ in image_bands]) for image_bands in bands]
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
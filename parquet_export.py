@@ -0,0 +1,129 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from export_tables import iter_personnel_changes, parse_amount, parse_order_date, parse_point_number
+
+# Рядків у групі рядків Parquet: дані таблиці накопичуються в пам'яті лише до цього обсягу
+ROW_GROUP_SIZE = 64 * 1024
+
+# Повторювані рядки (звання, дії, типи) зберігаються словником: менший файл,
+# а pandas читає їх одразу як category
+_CATEGORY = pa.dictionary(pa.int32(), pa.string())
+
+# Реквізити наказу, що повторюються в кожній дочірній таблиці для фільтрації без JOIN
+_ORDER_KEY_FIELDS = [
+    pa.field('file_hash', pa.string()),
+    pa.field('order_number', pa.string()),
+    pa.field('order_date', pa.date32()),
+    pa.field('military_unit', _CATEGORY),
+]
+
+SCHEMAS = {
+    'orders': pa.schema([
+        pa.field('file_hash', pa.string()),
+        pa.field('file_name', pa.string()),
+        pa.field('file_path', pa.string()),
+        pa.field('file_type', _CATEGORY),
+        pa.field('file_size', pa.int64()),
+        pa.field('order_type', _CATEGORY),
+        pa.field('order_number', pa.string()),
+        pa.field('order_date', pa.date32()),
+        pa.field('order_date_text', pa.string()),
+        pa.field('military_unit', _CATEGORY),
+        pa.field('is_extract', pa.bool_()),
+        pa.field('personnel_count', pa.int32()),
+        pa.field('encoding', _CATEGORY),
+        pa.field('error', pa.string()),
+        pa.field('processing_time', pa.timestamp('us')),
+    ]),
+    'personnel': pa.schema(_ORDER_KEY_FIELDS + [
+        pa.field('point_number', pa.int32()),
+        pa.field('full_name', pa.string()),
+        pa.field('rank', _CATEGORY),
+        pa.field('position', pa.string()),
+        pa.field('action', _CATEGORY),
+    ]),
+    'financial': pa.schema(_ORDER_KEY_FIELDS + [
+        pa.field('type', _CATEGORY),
+        pa.field('description', pa.string()),
+        pa.field('amount', pa.string()),
+        pa.field('amount_value', pa.float64()),
+    ]),
+    'documents': pa.schema(_ORDER_KEY_FIELDS + [
+        pa.field('type', _CATEGORY),
+        pa.field('description', pa.string()),
+        pa.field('duration', pa.string()),
+    ]),
+    'structural': pa.schema(_ORDER_KEY_FIELDS + [
+        pa.field('type', _CATEGORY),
+        pa.field('description', pa.string()),
+        pa.field('details', pa.string()),
+    ]),
+}
+
+
+def _processing_time(value: Optional[str]) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
+
+def _table_rows(table: str, orders_data: List[Dict]) -> Iterator[tuple]:
+    """Рядки таблиці у порядку колонок SCHEMAS[table]"""
+    for order in orders_data:
+        advanced = order.get('advanced_data') or {}
+        order_key = (order.get('file_hash'), order.get('number'), parse_order_date(order.get('date')),
+                     advanced.get('military_unit'))
+
+        if table == 'orders':
+            yield (order.get('file_hash'), order.get('file_name'), order.get('file_path'),
+                   order.get('file_type'), order.get('file_size'), order.get('type'),
+                   order.get('number'), order_key[2], order.get('date'), order_key[3],
+                   bool(advanced.get('is_extract')), len(order.get('personnel', [])),
+                   order.get('encoding'), order.get('error'),
+                   _processing_time(order.get('processing_time')))
+        elif table == 'personnel':
+            for change, person in iter_personnel_changes(order):
+                yield order_key + (parse_point_number(change.get('point_number')), person['full_name'],
+                                   person.get('rank'), person.get('position'),
+                                   change.get('type') or person.get('action'))
+        elif table == 'financial':
+            for op in advanced.get('financial_operations', []):
+                yield order_key + (op.get('type'), op.get('description'), op.get('amount'),
+                                   parse_amount(op.get('amount')))
+        elif table == 'documents':
+            for op in advanced.get('document_operations', []):
+                yield order_key + (op.get('type'), op.get('description'), op.get('duration'))
+        elif table == 'structural':
+            for change in advanced.get('structural_changes', []):
+                yield order_key + (change.get('type'), change.get('description'), change.get('details'))
+
+
+def _record_batch(schema: pa.Schema, rows: List[tuple]) -> pa.RecordBatch:
+    columns = list(zip(*rows))
+    return pa.record_batch([pa.array(column, type=field.type) for column, field in zip(columns, schema)],
+                           schema=schema)
+
+
+def write_parquet_tables(orders_data: List[Dict], output_dir: Path):
+    """Запис таблиць у output_dir, по файлу <таблиця>.parquet на кожну.
+
+    Рядки збираються групами по ROW_GROUP_SIZE і записуються окремими
+    групами рядків, тож пам'ять не залежить від загального обсягу даних.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for table, schema in SCHEMAS.items():
+        with pq.ParquetWriter(output_dir / f'{table}.parquet', schema, compression='zstd') as writer:
+            rows = []
+            for row in _table_rows(table, orders_data):
+                rows.append(row)
+                if len(rows) >= ROW_GROUP_SIZE:
+                    writer.write_batch(_record_batch(schema, rows))
+                    rows = []
+            if rows:
+                writer.write_batch(_record_batch(schema, rows))
@@ -0,0 +1,164 @@
+import importlib.util
+import mmap
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional, Tuple
+
+# Растеризація сторінок-сканів для OCR (необов'язкова залежність, потребує poppler).
+# PyPDF2 та pdf2image імпортуються при першому PDF, а не під час запуску програми
+PDF_RASTER_AVAILABLE = importlib.util.find_spec('pdf2image') is not None
+
+# Обмеження за замовчуванням на один документ
+DEFAULT_MAX_PAGES = 2000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Паралельне читання має сенс лише для великих документів
+PARALLEL_MIN_PAGES = 64
+PAGES_PER_TASK = 32
+
+# Сторінка з меншою кількістю непробільних символів вважається сканом без текстового шару
+MIN_PAGE_TEXT_CHARS = 20
+
+# Роздільна здатність растеризації сканів: достатня для tesseract без зайвого обсягу
+OCR_DPI = 300
+
+# Скільки сторінок-сканів растеризується і передається на OCR за раз (обмеження пам'яті)
+OCR_BATCH_PAGES = 8
+
+
+@contextmanager
+def open_pdf(file_path: str):
+    """PdfReader поверх mmap: файл не копіюється в пам'ять Python цілком"""
+    import PyPDF2
+
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError("Порожній PDF файл")
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield PyPDF2.PdfReader(mapped)
+        finally:
+            mapped.close()
+
+
+def iter_pdf_pages(file_path: str, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+    """Текст сторінок по одній (ліниво), у межах [start, stop)"""
+    with open_pdf(file_path) as reader:
+        stop = len(reader.pages) if stop is None else min(stop, len(reader.pages))
+        for page_number in range(start, stop):
+            yield reader.pages[page_number].extract_text() or ''
+
+
+def _extract_page_range(file_path: str, start: int, stop: int) -> List[str]:
+    """Задача для процесу-воркера: текст діапазону сторінок"""
+    return list(iter_pdf_pages(file_path, start, stop))
+
+
+def _page_ranges(total_pages: int, chunk: int) -> List[Tuple[int, int]]:
+    return [(start, min(start + chunk, total_pages)) for start in range(0, total_pages, chunk)]
+
+
+def read_pdf_text(file_path: str, max_pages: Optional[int] = DEFAULT_MAX_PAGES,
+                  max_bytes: Optional[int] = DEFAULT_MAX_BYTES, workers: int = 1,
+                  ocr: Optional[Callable[[List], List[str]]] = None, ocr_dpi: int = OCR_DPI) -> str:
+    """Текст PDF з обмеженням кількості сторінок та обсягу тексту.
+
+    Сторінки збираються у список і з'єднуються один раз. Для великих
+    документів при workers > 1 діапазони сторінок читаються паралельно
+    окремими процесами (кожен відкриває файл самостійно) і складаються у
+    вихідному порядку.
+
+    Якщо передано ocr (розпізнавання списку зображень), сторінки без
+    текстового шару растеризуються і розпізнаються, а їхній текст стає на
+    місце порожніх сторінок.
+    """
+    with open_pdf(file_path) as reader:
+        total_pages = len(reader.pages)
+        if max_pages is not None:
+            total_pages = min(total_pages, max_pages)
+
+        if workers <= 1 or total_pages < PARALLEL_MIN_PAGES:
+            pages = (reader.pages[page_number].extract_text() or '' for page_number in range(total_pages))
+            return _assemble(file_path, pages, max_bytes, ocr, ocr_dpi)
+
+    ranges = _page_ranges(total_pages, PAGES_PER_TASK)
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as executor:
+        chunks = executor.map(_extract_page_range, [file_path] * len(ranges),
+                              [start for start, _ in ranges], [stop for _, stop in ranges])
+        pages = (page for chunk in chunks for page in chunk)
+        return _assemble(file_path, pages, max_bytes, ocr, ocr_dpi)
+
+
+def _assemble(file_path: str, pages: Iterator[str], max_bytes: Optional[int],
+              ocr: Optional[Callable[[List], List[str]]], ocr_dpi: int) -> str:
+    if ocr is None or not PDF_RASTER_AVAILABLE:
+        return '\n'.join(_take_limited(pages, max_bytes))
+
+    texts = _take_limited(pages, max_bytes)
+    scanned = [page_number for page_number, page_text in enumerate(texts) if needs_ocr(page_text)]
+    if scanned:
+        try:
+            for page_number, page_text in zip(scanned, ocr_pdf_pages(file_path, scanned, ocr, ocr_dpi)):
+                texts[page_number] = page_text
+        except Exception as e:
+            # Без poppler чи при пошкодженій сторінці лишається текстовий шар
+            print(f"Увага: не вдалося розпізнати сторінки-скани {file_path}: {e}", file=sys.stderr)
+    return '\n'.join(_take_limited(texts, max_bytes))
+
+
+def needs_ocr(page_text: str) -> bool:
+    """Сторінка без текстового шару або майже порожня (скан)"""
+    return sum(1 for char in page_text if not char.isspace()) < MIN_PAGE_TEXT_CHARS
+
+
+def ocr_pdf_pages(file_path: str, page_numbers: List[int], ocr: Callable[[List], List[str]],
+                  dpi: int = OCR_DPI) -> List[str]:
+    """Растеризація вказаних сторінок і їх розпізнавання пакетами.
+
+    Суміжні сторінки растеризуються одним викликом poppler; до OCR
+    передається до OCR_BATCH_PAGES зображень, які розпізнаються паралельно.
+    Діапазон, що не вміщується в поточний пакет, розбивається, тож у пам'яті
+    одночасно не більше OCR_BATCH_PAGES растрових сторінок.
+    Результати повертаються в порядку page_numbers.
+    """
+    from pdf2image import convert_from_path
+
+    texts: List[str] = []
+    images = []
+    for first, last in _page_runs(page_numbers, OCR_BATCH_PAGES):
+        while first <= last:
+            end = min(last, first + OCR_BATCH_PAGES - len(images) - 1)
+            images.extend(convert_from_path(file_path, dpi=dpi, first_page=first + 1,
+                                            last_page=end + 1, grayscale=True))
+            first = end + 1
+            if len(images) >= OCR_BATCH_PAGES:
+                texts.extend(ocr(images))
+                images = []
+    if images:
+        texts.extend(ocr(images))
+    return texts
+
+
+def _page_runs(page_numbers: List[int], max_run: int) -> List[Tuple[int, int]]:
+    """Групування відсортованих номерів сторінок у суміжні діапазони [first, last]"""
+    runs: List[Tuple[int, int]] = []
+    for page_number in page_numbers:
+        if runs and runs[-1][1] == page_number - 1 and page_number - runs[-1][0] < max_run:
+            runs[-1] = (runs[-1][0], page_number)
+        else:
+            runs.append((page_number, page_number))
+    return runs
+
+
+def _take_limited(pages: Iterator[str], max_bytes: Optional[int]) -> List[str]:
+    """Сторінки по порядку до перевищення ліміту обсягу тексту"""
+    parts = []
+    size = 0
+    for page_text in pages:
+        parts.append(page_text)
+        size += len(page_text.encode('utf-8'))
+        if max_bytes is not None and size >= max_bytes:
+            break
+    return parts
@@ -0,0 +1,81 @@
+import bisect
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from stats_aggregate import StatsAggregate
+
+
+class ResultsStore:
+    """Впорядкований набір результатів аналізу з індексом за повним шляхом файлу.
+
+    Порядок записів задається ключем порядку (індекс файлу у пакеті), тому
+    результати, що надходять з пулу процесів у довільному порядку, стають на
+    своє місце. Оновлення та видалення окремих файлів не перебудовують список,
+    а запис за шляхом береться зі словника без пошуку. Статистика stats
+    оновлюється разом із кожною зміною.
+    """
+
+    def __init__(self):
+        self.records: List[Dict] = []
+        self._keys: List[int] = []
+        self._key_by_path: Dict[str, int] = {}
+        self._record_by_path: Dict[str, Dict] = {}
+        self._next_key = 0
+        self.stats = StatsAggregate()
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[Dict]:
+        return iter(self.records)
+
+    def clear(self):
+        self.records.clear()
+        self._keys.clear()
+        self._key_by_path.clear()
+        self._record_by_path.clear()
+        self._next_key = 0
+        self.stats.clear()
+
+    def put(self, record: Dict, order_key: Optional[int] = None) -> Tuple[int, bool]:
+        """Додавання або заміна запису; повертає (позиція, чи була заміна)"""
+        path = record['file_path']
+        if path in self._key_by_path:
+            position = self.position(path)
+            self.stats.remove(self.records[position])
+            self.stats.add(record)
+            self.records[position] = record
+            self._record_by_path[path] = record
+            return position, True
+
+        if order_key is None:
+            order_key = self._next_key
+        self._next_key = max(self._next_key, order_key + 1)
+
+        position = bisect.bisect_left(self._keys, order_key)
+        self._keys.insert(position, order_key)
+        self.records.insert(position, record)
+        self._key_by_path[path] = order_key
+        self._record_by_path[path] = record
+        self.stats.add(record)
+        return position, False
+
+    def remove(self, path: str) -> Optional[Dict]:
+        """Видалення запису за шляхом файлу"""
+        if path not in self._key_by_path:
+            return None
+        position = self.position(path)
+        del self._key_by_path[path]
+        del self._record_by_path[path]
+        del self._keys[position]
+        record = self.records.pop(position)
+        self.stats.remove(record)
+        return record
+
+    def get(self, path: str) -> Optional[Dict]:
+        return self._record_by_path.get(path)
+
+    def position(self, path: str) -> int:
+        return bisect.bisect_left(self._keys, self._key_by_path[path])
+
+    def paths(self) -> List[str]:
+        return list(self._key_by_path)
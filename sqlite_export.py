@@ -0,0 +1,197 @@
+import os
+import sqlite3
+from typing import Dict, List
+
+from disk_cache import file_digest
+from export_tables import iter_personnel_changes, parse_amount, parse_order_date, parse_point_number
+
+# Версія схеми бази (PRAGMA user_version)
+SCHEMA_VERSION = 1
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS orders (
+    id INTEGER PRIMARY KEY,
+    file_hash TEXT NOT NULL UNIQUE,
+    file_path TEXT,
+    file_name TEXT,
+    file_type TEXT,
+    file_size INTEGER,
+    order_type TEXT,
+    order_number TEXT,
+    order_date TEXT,          -- ISO 8601 (РРРР-ММ-ДД), якщо дату розпізнано
+    order_date_text TEXT,     -- дата як у документі
+    military_unit TEXT,
+    is_extract INTEGER NOT NULL DEFAULT 0,
+    encoding TEXT,
+    error TEXT,
+    processing_time TEXT,
+    raw_text TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_orders_path ON orders(file_path);
+CREATE INDEX IF NOT EXISTS idx_orders_number ON orders(order_number);
+CREATE INDEX IF NOT EXISTS idx_orders_date ON orders(order_date);
+CREATE INDEX IF NOT EXISTS idx_orders_unit ON orders(military_unit);
+
+CREATE TABLE IF NOT EXISTS persons (
+    id INTEGER PRIMARY KEY,
+    full_name TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS personnel_changes (
+    id INTEGER PRIMARY KEY,
+    order_id INTEGER NOT NULL REFERENCES orders(id) ON DELETE CASCADE,
+    person_id INTEGER NOT NULL REFERENCES persons(id),
+    point_number INTEGER,
+    action TEXT,
+    rank TEXT,
+    position TEXT,
+    content TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_changes_order ON personnel_changes(order_id);
+CREATE INDEX IF NOT EXISTS idx_changes_person ON personnel_changes(person_id);
+CREATE INDEX IF NOT EXISTS idx_changes_action ON personnel_changes(action);
+
+CREATE TABLE IF NOT EXISTS financial_ops (
+    id INTEGER PRIMARY KEY,
+    order_id INTEGER NOT NULL REFERENCES orders(id) ON DELETE CASCADE,
+    type TEXT,
+    description TEXT,
+    amount TEXT,
+    amount_value REAL
+);
+CREATE INDEX IF NOT EXISTS idx_financial_order ON financial_ops(order_id);
+
+CREATE TABLE IF NOT EXISTS document_ops (
+    id INTEGER PRIMARY KEY,
+    order_id INTEGER NOT NULL REFERENCES orders(id) ON DELETE CASCADE,
+    type TEXT,
+    description TEXT,
+    duration TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_document_order ON document_ops(order_id);
+
+-- Зміни персоналу разом з реквізитами наказу, для запитів без JOIN
+CREATE VIEW IF NOT EXISTS personnel_changes_view AS
+SELECT o.order_number, o.order_date, o.order_type, o.military_unit,
+       p.full_name, c.rank, c.position, c.action, c.point_number,
+       o.file_name, o.file_path
+FROM personnel_changes c
+JOIN persons p ON p.id = c.person_id
+JOIN orders o ON o.id = c.order_id;
+'''
+
+
+class SqliteExporter:
+    """Експорт результатів у нормалізовану базу SQLite з дописуванням.
+
+    Документ ідентифікується хешем вмісту файлу: повторний експорт того
+    самого документа оновлює його рядок і замінює його дочірні записи, нові
+    документи додаються, а решта бази не переписується. Змінений файл має
+    новий хеш: попередня версія з тим самим шляхом видаляється разом з
+    дочірніми записами.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA foreign_keys=ON')
+        self._conn.executescript(SCHEMA)
+        self._conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        self._person_ids: Dict[str, int] = {}
+
+    def upsert_all(self, orders_data: List[Dict]) -> int:
+        """Запис усіх документів однією транзакцією; повертає кількість записаних"""
+        written = 0
+        with self._conn:
+            for order in orders_data:
+                if self.upsert(order):
+                    written += 1
+        return written
+
+    def upsert(self, order: Dict) -> bool:
+        file_hash = self._file_hash(order)
+        if file_hash is None:
+            return False
+
+        order_date = parse_order_date(order.get('date'))
+        advanced = order.get('advanced_data') or {}
+        values = {
+            'file_hash': file_hash,
+            'file_path': order.get('file_path'),
+            'file_name': order.get('file_name'),
+            'file_type': order.get('file_type'),
+            'file_size': order.get('file_size'),
+            'order_type': order.get('type'),
+            'order_number': order.get('number'),
+            'order_date': order_date.isoformat() if order_date else None,
+            'order_date_text': order.get('date'),
+            'military_unit': advanced.get('military_unit'),
+            'is_extract': int(bool(advanced.get('is_extract'))),
+            'encoding': order.get('encoding'),
+            'error': order.get('error'),
+            'processing_time': order.get('processing_time'),
+            'raw_text': order.get('raw_text'),
+        }
+
+        row = self._conn.execute('SELECT id FROM orders WHERE file_hash = ?', (file_hash,)).fetchone()
+        if row is None:
+            if values['file_path']:
+                # Застарілі версії файлу (інший хеш за тим самим шляхом); дочірні — ON DELETE CASCADE
+                self._conn.execute('DELETE FROM orders WHERE file_path = ?', (values['file_path'],))
+            columns = ', '.join(values)
+            placeholders = ', '.join('?' * len(values))
+            order_id = self._conn.execute(f'INSERT INTO orders ({columns}) VALUES ({placeholders})',
+                                          list(values.values())).lastrowid
+        else:
+            order_id = row[0]
+            assignments = ', '.join(f'{column} = ?' for column in values)
+            self._conn.execute(f'UPDATE orders SET {assignments} WHERE id = ?', [*values.values(), order_id])
+            for table in ('personnel_changes', 'financial_ops', 'document_ops'):
+                self._conn.execute(f'DELETE FROM {table} WHERE order_id = ?', (order_id,))
+
+        self._conn.executemany(
+            'INSERT INTO personnel_changes (order_id, person_id, point_number, action, rank, position, content) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            [(order_id, self._person_id(person['full_name']), parse_point_number(change.get('point_number')),
+              change.get('type') or person.get('action'), person.get('rank'), person.get('position'),
+              change.get('content'))
+             for change, person in iter_personnel_changes(order)]
+        )
+        self._conn.executemany(
+            'INSERT INTO financial_ops (order_id, type, description, amount, amount_value) VALUES (?, ?, ?, ?, ?)',
+            [(order_id, op.get('type'), op.get('description'), op.get('amount'), parse_amount(op.get('amount')))
+             for op in advanced.get('financial_operations', [])]
+        )
+        self._conn.executemany(
+            'INSERT INTO document_ops (order_id, type, description, duration) VALUES (?, ?, ?, ?)',
+            [(order_id, op.get('type'), op.get('description'), op.get('duration'))
+             for op in advanced.get('document_operations', [])]
+        )
+        return True
+
+    def _person_id(self, full_name: str) -> int:
+        person_id = self._person_ids.get(full_name)
+        if person_id is None:
+            self._conn.execute('INSERT OR IGNORE INTO persons (full_name) VALUES (?)', (full_name,))
+            person_id = self._conn.execute('SELECT id FROM persons WHERE full_name = ?',
+                                           (full_name,)).fetchone()[0]
+            self._person_ids[full_name] = person_id
+        return person_id
+
+    @staticmethod
+    def _file_hash(order: Dict):
+        """Хеш вмісту з результату; для записів без нього (помилки) — обчислюється з файлу"""
+        if order.get('file_hash'):
+            return order['file_hash']
+        file_path = order.get('file_path')
+        if not file_path:
+            return None
+        try:
+            return file_digest(file_path)
+        except OSError:
+            # Файлу вже немає: документ ідентифікується шляхом
+            return f"path:{os.path.abspath(file_path)}"
+
+    def close(self):
+        self._conn.close()
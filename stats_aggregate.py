@@ -0,0 +1,67 @@
+from collections import Counter
+from typing import Dict, Iterable, Optional
+
+
+class StatsAggregate:
+    """Поточна статистика результатів, що оновлюється з кожним записом.
+
+    add/remove коштують стільки, скільки осіб у самому документі, і не
+    залежать від кількості вже проаналізованих документів. Документи з
+    помилкою враховуються лише в загальній кількості та кількості помилок.
+    """
+
+    def __init__(self):
+        self.total_orders = 0
+        self.failed_orders = 0
+        self.total_personnel = 0
+        self.order_types: Counter = Counter()
+        self.actions: Counter = Counter()
+        self.ranks: Counter = Counter()
+        self.units: Counter = Counter()
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict]) -> 'StatsAggregate':
+        stats = cls()
+        for record in records:
+            stats.add(record)
+        return stats
+
+    @property
+    def successful_orders(self) -> int:
+        return self.total_orders - self.failed_orders
+
+    def add(self, record: Dict):
+        self._apply(record, 1)
+
+    def remove(self, record: Dict):
+        self._apply(record, -1)
+
+    def clear(self):
+        self.total_orders = 0
+        self.failed_orders = 0
+        self.total_personnel = 0
+        for counter in (self.order_types, self.actions, self.ranks, self.units):
+            counter.clear()
+
+    def _apply(self, record: Dict, sign: int):
+        self.total_orders += sign
+        if 'error' in record:
+            self.failed_orders += sign
+            return
+
+        personnel = record.get('personnel', [])
+        self.total_personnel += sign * len(personnel)
+        self._count(self.order_types, record.get('type', 'невідомо'), sign)
+        self._count(self.units, (record.get('advanced_data') or {}).get('military_unit'), sign)
+        for person in personnel:
+            self._count(self.actions, person.get('action'), sign)
+            self._count(self.ranks, person.get('rank'), sign)
+
+    @staticmethod
+    def _count(counter: Counter, key: Optional[str], sign: int):
+        if not key:
+            return
+        counter[key] += sign
+        if counter[key] <= 0:
+            del counter[key]
+
@@ -0,0 +1,99 @@
+import codecs
+import mmap
+import os
+import re
+from typing import Optional, Tuple
+
+# Файли, більші за цей розмір, читаються через mmap без проміжної копії
+MMAP_MIN_BYTES = 1024 * 1024
+
+# Обсяг зразка для визначення кодування
+SAMPLE_BYTES = 64 * 1024
+
+# BOM у порядку перевірки (UTF-32 раніше за UTF-16, бо їхні BOM мають спільний початок)
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# Однобайтові кириличні кодування, між якими обирається за частотою літер
+SINGLE_BYTE_ENCODINGS = ('cp1251', 'koi8-u')
+
+# Найчастіші літери українських текстів. Рахуються без урахування регістру:
+# витяги з наказів часто набрані великими літерами, а в «чужому» кодуванні
+# ці байти перетворюються на інші, рідкісніші літери та символи
+_FREQUENT_LETTERS = 'оаніеитвросклдмпу'
+
+_NON_ASCII_RE = re.compile(rb'[\x80-\xff]')
+
+
+def detect_encoding(data) -> str:
+    """Визначення кодування за байтами: BOM, коректність UTF-8 на зразку,
+    далі частота кириличних літер для cp1251 та KOI8-U.
+
+    Якщо початок файлу суто ASCII, зразок береться з першого не-ASCII байта.
+    """
+    head = bytes(data[:4])
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding
+
+    sample = _non_ascii_sample(data)
+    if sample is None:
+        return 'utf-8'
+
+    # Інкрементальний декодер не вважає помилкою символ, обрізаний межею зразка
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+
+    return _single_byte_encoding(sample)
+
+
+def _non_ascii_sample(data, start: int = 0) -> Optional[bytes]:
+    """Зразок для визначення кодування: з start, а якщо там лише ASCII — з першого
+    не-ASCII байта далі; None, якщо таких байтів немає"""
+    sample = bytes(data[start:start + SAMPLE_BYTES])
+    if sample.isascii():
+        match = _NON_ASCII_RE.search(data, start)
+        if match is None:
+            return None
+        sample = bytes(data[match.start():match.start() + SAMPLE_BYTES])
+    return sample
+
+
+def _single_byte_encoding(sample: bytes) -> str:
+    return max(SINGLE_BYTE_ENCODINGS, key=lambda encoding: _letter_score(sample, encoding))
+
+
+def _letter_score(sample: bytes, encoding: str) -> int:
+    decoded = sample.decode(encoding, errors='replace').lower()
+    return sum(decoded.count(letter) for letter in _FREQUENT_LETTERS)
+
+
+def decode_bytes(data) -> Tuple[str, str]:
+    """Декодування один раз у визначеному кодуванні; повертає (текст, кодування)"""
+    encoding = detect_encoding(data)
+    try:
+        return str(data, encoding), encoding
+    except UnicodeDecodeError as e:
+        # Некоректний UTF-8 далі за зразком: текст в однобайтовому кодуванні.
+        # Літери рахуються з першого некоректного байта — початок файлу може бути
+        # суто ASCII або коректним UTF-8 і однаково «оцінюється» для обох кодувань
+        encoding = _single_byte_encoding(_non_ascii_sample(data, e.start))
+        return str(data, encoding, errors='replace'), encoding
+
+
+def read_text_file(file_path: str) -> Tuple[str, str]:
+    """Читання текстового файлу одним проходом по байтах; повертає (текст, кодування)"""
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_MIN_BYTES:
+            return decode_bytes(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return decode_bytes(mapped)
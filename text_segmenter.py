@@ -0,0 +1,110 @@
+import bisect
+import re
+from typing import List, NamedTuple, Optional, Tuple
+
+# Слова, що завершують текст пункту наказу
+ORDER_STOP_WORDS = ('Підстава',)
+EXTRACT_STOP_WORDS = ('Командир', 'Підстава')
+
+# Маркер пункту «12. »: перед ним початок тексту або пробіл, після крапки —
+# пробіл або велика літера. Тому дати «12.05.2024» та номери «№ 125.» не
+# вважаються початком пункту.
+_POINT_MARKER = r'(?<![^\s])(?<!№ )(?P<number>\d{1,4})\.(?=\s|[А-ЯІЇЄҐA-Z])'
+
+# Номери пунктів зростають; більший стрибок означає число в тексті
+# (наприклад, рік «у 2024. »), а не новий пункт. Повернення до «1.» —
+# новий розділ зведеного наказу, де нумерація починається знову
+MAX_POINT_GAP = 50
+RESTART_POINT = 1
+MAX_FIRST_POINT = 999
+
+
+class PointSpan(NamedTuple):
+    """Фрагмент тексту наказу: пункт (number задано) або текст поза пунктами"""
+    number: Optional[str]
+    start: int
+    end: int
+
+    def content(self, text: str) -> str:
+        return text[self.start:self.end].strip()
+
+
+_segment_regex_cache = {}
+
+
+def _segment_regex(stop_words: Tuple[str, ...]):
+    regex = _segment_regex_cache.get(stop_words)
+    if regex is None:
+        stops = '|'.join(re.escape(word) for word in stop_words)
+        regex = re.compile(f'{_POINT_MARKER}|(?P<stop>{stops})')
+        _segment_regex_cache[stop_words] = regex
+    return regex
+
+
+def segment_points(text: str, stop_words: Tuple[str, ...] = ORDER_STOP_WORDS) -> List[PointSpan]:
+    """Розбиття тексту на пункти за один прохід.
+
+    Маркери пунктів і стоп-слова знаходяться одним регулярним виразом, далі
+    межі фрагментів визначаються між сусідніми маркерами. Повертаються всі
+    фрагменти по порядку, включно з преамбулою та текстом після стоп-слів
+    (для них number дорівнює None), тож разом вони покривають весь текст.
+    """
+    spans = []
+    current_number = None
+    current_start = 0
+    last_point = 0
+
+    for match in _segment_regex(stop_words).finditer(text):
+        if match.group('number') is not None:
+            number = int(match.group('number'))
+            limit = MAX_FIRST_POINT if last_point == 0 else last_point + MAX_POINT_GAP
+            if not (last_point < number <= limit or number == RESTART_POINT):
+                continue
+            last_point = number
+            spans.append(PointSpan(current_number, current_start, match.start()))
+            current_number = match.group('number')
+            current_start = match.end()
+        elif current_number is not None:
+            # Стоп-слово завершує пункт; далі до наступного маркера — текст поза пунктами
+            spans.append(PointSpan(current_number, current_start, match.start()))
+            current_number = None
+            current_start = match.start()
+
+    spans.append(PointSpan(current_number, current_start, len(text)))
+    return [span for span in spans if span.end > span.start]
+
+
+def numbered_points(spans: List[PointSpan]) -> List[PointSpan]:
+    """Лише пронумеровані пункти"""
+    return [span for span in spans if span.number is not None]
+
+
+class PositionIndex:
+    """Індекс посад у фрагменті тексту для пошуку посади за місцем згадки ПІБ.
+
+    Усі звороти «на посаду» знаходяться одним проходом при побудові; посада
+    для імені — текст до крапки після найближчого звороту за кінцем його
+    згадки (бінарний пошук), без окремого регулярного виразу для кожного
+    імені. Зворот лише позначає початок і не поглинає текст, тож кілька
+    зворотів в одному реченні («на посаду водія, ... на посаду стрільця»)
+    знаходяться всі.
+    """
+
+    _CLAUSE_RE = re.compile(r'на посаду\s*', re.IGNORECASE)
+    _POSITION_RE = re.compile(r'[^\.]+')
+
+    def __init__(self, text: str):
+        self._text = text
+        self._starts: List[int] = []
+        self._value_starts: List[int] = []
+        for match in self._CLAUSE_RE.finditer(text):
+            self._starts.append(match.start())
+            self._value_starts.append(match.end())
+
+    def position_after(self, offset: int) -> Optional[str]:
+        """Посада з першого звороту, що починається не раніше offset"""
+        for index in range(bisect.bisect_left(self._starts, offset), len(self._starts)):
+            match = self._POSITION_RE.match(self._text, self._value_starts[index])
+            if match:
+                return match.group(0).strip()
+        return None
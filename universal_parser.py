@@ -1,25 +1,161 @@
 import re
 import os
+import sys
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 import json
-from docx import Document
-import PyPDF2
-import pandas as pd
-
-# Спроба імпорту бібліотек для OCR
-try:
-    import pytesseract
-    from PIL import Image, ImageEnhance, ImageFilter
-    OCR_AVAILABLE = True
-except ImportError:
-    OCR_AVAILABLE = False
-    print("Увага: бібліотеки для OCR не встановлені. Функція розпізнавання текстів з фото буде недоступна.")
+import hashlib
+import importlib.util
+from functools import cached_property
+
+from disk_cache import OcrCache
+from docx_reader import read_docx_text
+from keyword_matcher import KeywordMatcher
+from pdf_reader import (DEFAULT_MAX_BYTES, DEFAULT_MAX_PAGES, OCR_DPI, PDF_RASTER_AVAILABLE,
+                        read_pdf_text)
+from text_reader import read_text_file
+from text_segmenter import (EXTRACT_STOP_WORDS, ORDER_STOP_WORDS, PointSpan,
+                            PositionIndex, numbered_points, segment_points)
+
+# Бібліотеки для OCR лише шукаються; імпортуються при першому розпізнаванні,
+# щоб не сповільнювати запуск програми
+OCR_AVAILABLE = all(importlib.util.find_spec(name) is not None for name in ('pytesseract', 'PIL'))
+if not OCR_AVAILABLE:
+    print("Увага: бібліотеки для OCR не встановлені. Функція розпізнавання текстів з фото буде недоступна.", file=sys.stderr)
+
+# Версія логіки розбору; змінюється разом з форматом результату parse_document
+PARSER_VERSION = '1.14'
+
+# Версія попередньої обробки зображень; змінюється разом з _preprocess_image
+PREPROCESS_VERSION = '1'
+
+# Розширення файлів, які вміє читати парсер
+SUPPORTED_EXTENSIONS = ('.txt', '.docx', '.pdf', '.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif')
+
+# Артефакти OCR (послідовності службових символів) замінюються пробілом
+_ARTIFACTS_RE = re.compile(r'[^\w\sА-ЯІЇЄа-яіїєґҐ.,;:!?()\-—№\'"]+')
+
+# Номер наказу (варіанти «Наказ ... №» та «НАКАЗ ... №» покриваються цим же шаблоном)
+_ORDER_NUMBER_RE = re.compile(r'№\s*(\d+)')
+
+_DATE_RES = [
+    re.compile(r'\b(\d{1,2}\.\d{1,2}\.\d{4})\b'),
+    re.compile(r'\b(\d{1,2}\s+[сС]ічня|[лЛ]ютого|[бБ]ерезня|[кК]вітня|[тТ]равня|[чЧ]ервня|[лЛ]ипня|[сС]ерпня|[вВ]ересня|[жЖ]овтня|[лЛ]истопада|[гГ]рудня)\s+(\d{4})')
+]
+
+_MILITARY_UNIT_RE = re.compile(r'військової частини\s*([А-Я]\d+)', re.IGNORECASE)
+
+# Ознаки витягу з наказу (у нижньому регістрі)
+_EXTRACT_MARKERS = ('в и т я г і з н а к а з у', 'витяг із наказу')
+
+
+def clean_text(text: str) -> str:
+    """Очищення тексту від зайвих пробілів та артефактів.
+
+    Один прохід регулярним виразом по артефактах, а пробіли згортаються через
+    split()/join(), що помітно швидше за другий прохід re.sub(r'\s+').
+    """
+    return ' '.join(_ARTIFACTS_RE.sub(' ', text).split())
+
+
+def find_order_number(text: str) -> Optional[str]:
+    """Витягнення номера наказу"""
+    match = _ORDER_NUMBER_RE.search(text)
+    return match.group(1) if match else None
+
+
+def find_date(text: str) -> Optional[str]:
+    """Витягнення дати наказу"""
+    for pattern in _DATE_RES:
+        match = pattern.search(text)
+        if match:
+            if len(match.groups()) == 1:
+                return match.group(1)
+            return f"{match.group(1)} {match.group(2)}"
+    return None
+
+
+class DocumentContext:
+    """Спільний контекст аналізу одного документа.
+
+    Текст нормалізується один раз, а нижній регістр, збіги ключових слів та
+    реквізити наказу (тип, номер, дата, військова частина) обчислюються
+    ліниво не більше одного разу. Обидва парсери беруть реквізити звідси,
+    тому для документа існує одна узгоджена відповідь.
+    """
+
+    def __init__(self, text: str, keywords: KeywordMatcher):
+        self.text = text
+        self.keywords = keywords
+
+    @classmethod
+    def from_raw(cls, raw_text: str, keywords: KeywordMatcher) -> 'DocumentContext':
+        return cls(clean_text(raw_text), keywords)
+
+    @cached_property
+    def lower(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def keyword_hits(self) -> Dict[str, str]:
+        """Перші збіги типу наказу, дії та звання за один прохід"""
+        return self.keywords.scan(self.text)
+
+    @cached_property
+    def is_extract(self) -> bool:
+        return any(marker in self.lower for marker in _EXTRACT_MARKERS)
+
+    @cached_property
+    def segments(self) -> List[PointSpan]:
+        """Фрагменти тексту (пункти наказу та текст поза ними), розбиті один раз"""
+        stop_words = EXTRACT_STOP_WORDS if self.is_extract else ORDER_STOP_WORDS
+        return segment_points(self.text, stop_words)
+    
+    @cached_property
+    def order_type(self) -> str:
+        # Витяги завжди належать до наказів по стройовій частині
+        if self.is_extract:
+            return 'service'
+        return self.keyword_hits.get('order_type', 'невідомо')
+
+    @cached_property
+    def order_number(self) -> Optional[str]:
+        return find_order_number(self.text)
+
+    @cached_property
+    def date(self) -> Optional[str]:
+        return find_date(self.text)
+
+    @cached_property
+    def military_unit(self) -> Optional[str]:
+        match = _MILITARY_UNIT_RE.search(self.text)
+        return match.group(1) if match else None
+
 
 class UniversalOrderParser:
-    def __init__(self):
+    def __init__(self, pdf_workers: int = 1, pdf_max_pages: Optional[int] = DEFAULT_MAX_PAGES,
+                 pdf_max_bytes: Optional[int] = DEFAULT_MAX_BYTES, ocr_workers: Optional[int] = None,
+                 ocr_cache: bool = True, pdf_ocr: bool = True, pdf_ocr_dpi: int = OCR_DPI,
+                 ocr_slots=None):
+        # pdf_workers > 1 — паралельне читання сторінок великих PDF окремими процесами
+        self.pdf_workers = pdf_workers
+        # Розмір власного пулу процесів OCR (None — за кількістю ядер)
+        self.ocr_workers = ocr_workers
+        # Спільне з іншими процесами обмеження одночасних розпізнавань (див. OcrPipeline)
+        self.ocr_slots = ocr_slots
+        self._ocr_pipeline = None
+        # Кеш розпізнаного тексту на диску (відкривається при першому зображенні)
+        self.use_ocr_cache = ocr_cache
+        self._ocr_cache = None
+        self.pdf_max_pages = pdf_max_pages
+        self.pdf_max_bytes = pdf_max_bytes
+        # Гібридний режим PDF: сторінки без текстового шару розпізнаються через OCR
+        self.pdf_ocr = pdf_ocr and OCR_AVAILABLE and PDF_RASTER_AVAILABLE
+        self.pdf_ocr_dpi = pdf_ocr_dpi
         self.load_patterns()
-        self.advanced_parser = AdvancedOrderParser()
+        # Автомат ключових слів будується один раз і спільний для обох парсерів
+        self.keywords = KeywordMatcher.from_patterns(self.patterns)
+        self.advanced_parser = AdvancedOrderParser(self.keywords)
         
     def load_patterns(self):
         """Завантаження шаблонів для розпізнавання"""
@@ -29,6 +165,16 @@ class UniversalOrderParser:
         except FileNotFoundError:
             self.patterns = self.get_default_patterns()
     
+    def fingerprint(self) -> str:
+        """Відбиток версії парсера та шаблонів (для інвалідації кешу)"""
+        payload = json.dumps({
+            'patterns': self.patterns,
+            # Обмеження обсягу впливають на результат, тому входять у відбиток
+            'pdf_limits': [self.pdf_max_pages, self.pdf_max_bytes],
+            'pdf_ocr': [self.pdf_ocr, self.pdf_ocr_dpi]
+        }, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(f"{PARSER_VERSION}\n{payload}".encode('utf-8')).hexdigest()[:16]
+    
     def get_default_patterns(self):
         """Стандартні шаблони для розпізнавання"""
         return {
@@ -65,50 +211,40 @@ class UniversalOrderParser:
     
     def read_file(self, file_path: str) -> str:
         """Універсальне читання файлів всіх підтримуваних форматів"""
+        return self.read_document(file_path)[0]
+    
+    def read_document(self, file_path: str) -> Tuple[str, Optional[str]]:
+        """Читання файлу: (текст, кодування); кодування визначається лише для текстових файлів"""
         file_ext = os.path.splitext(file_path)[1].lower()
         
         try:
             if file_ext == '.txt':
                 return self._read_text_file(file_path)
             elif file_ext == '.docx':
-                return self._read_docx_file(file_path)
+                return self._read_docx_file(file_path), None
             elif file_ext == '.pdf':
-                return self._read_pdf_file(file_path)
+                return self._read_pdf_file(file_path), None
             elif file_ext in ['.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif']:
-                return self._read_image_file(file_path)
+                return self._read_image_file(file_path), None
             else:
                 raise ValueError(f"Непідтримуваний формат файлу: {file_ext}")
         except Exception as e:
             raise Exception(f"Помилка читання файлу {file_path}: {str(e)}")
     
-    def _read_text_file(self, file_path: str) -> str:
-        """Читання текстових файлів"""
-        encodings = ['utf-8', 'windows-1251', 'cp1251', 'iso-8859-1']
-        
-        for encoding in encodings:
-            try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    return f.read()
-            except UnicodeDecodeError:
-                continue
-        
-        # Якщо жодна кодування не підійшла, спробуємо latin-1 з заміною помилок
-        with open(file_path, 'r', encoding='latin-1', errors='replace') as f:
-            return f.read()
+    def _read_text_file(self, file_path: str) -> Tuple[str, str]:
+        """Читання текстових файлів: байти читаються один раз, кодування визначається за ними"""
+        return read_text_file(file_path)
     
     def _read_docx_file(self, file_path: str) -> str:
-        """Читання DOCX файлів"""
-        doc = Document(file_path)
-        return '\n'.join([paragraph.text for paragraph in doc.paragraphs])
+        """Читання DOCX файлів (абзаци та таблиці, потоково з архіву)"""
+        return read_docx_text(file_path)
     
     def _read_pdf_file(self, file_path: str) -> str:
-        """Читання PDF файлів"""
-        with open(file_path, 'rb') as f:
-            pdf_reader = PyPDF2.PdfReader(f)
-            text = ''
-            for page in pdf_reader.pages:
-                text += page.extract_text()
-            return text
+        """Читання PDF файлів (посторінково, з обмеженням обсягу)"""
+        return read_pdf_text(file_path, max_pages=self.pdf_max_pages,
+                             max_bytes=self.pdf_max_bytes, workers=self.pdf_workers,
+                             ocr=self._recognize_images if self.pdf_ocr else None,
+                             ocr_dpi=self.pdf_ocr_dpi)
     
     def _read_image_file(self, file_path: str) -> str:
         """Читання текстів з зображень за допомогою OCR"""
@@ -116,25 +252,63 @@ class UniversalOrderParser:
             raise ImportError("Бібліотеки для OCR не встановлені. Встановіть: pip install pytesseract pillow")
         
         try:
-            # Відкриваємо та обробляємо зображення
-            image = Image.open(file_path)
-            
-            # Попередня обробка зображення для покращення розпізнавання
-            processed_image = self._preprocess_image(image)
-            
-            # Конфігурація для української мови
-            custom_config = r'--oem 3 --psm 6 -l ukr+eng'
+            from PIL import Image
             
-            # Виконуємо OCR
-            text = pytesseract.image_to_string(processed_image, config=custom_config)
-            
-            return text
+            # Відкриваємо та розпізнаємо зображення
+            image = Image.open(file_path)
+            return self._recognize_images([image])[0]
             
         except Exception as e:
             raise Exception(f"Помилка OCR обробки зображення: {str(e)}")
     
-    def _preprocess_image(self, image: Image.Image) -> Image.Image:
+    def _recognize_images(self, images: List['Image.Image']) -> List[str]:
+        """OCR кількох зображень (фото чи сторінок-сканів PDF) з кешем, у вихідному порядку"""
+        from ocr_pipeline import image_digest
+        
+        texts: List[Optional[str]] = [None] * len(images)
+        
+        # Те саме зображення (зокрема копія в іншій папці) береться з кешу
+        cache = self.ocr_cache
+        hashes = [image_digest(image) for image in images] if cache is not None else []
+        if cache is not None:
+            for index, image_hash in enumerate(hashes):
+                texts[index] = cache.get(image_hash)
+        
+        missing = [index for index, text in enumerate(texts) if text is None]
+        if missing:
+            # Попередня обробка зображень для покращення розпізнавання
+            processed = [self._preprocess_image(images[index]) for index in missing]
+            # Одне зображення — смугами паралельно, кілька — по зображенню на процес
+            for index, text in zip(missing, self.ocr_pipeline.recognize_many(processed)):
+                texts[index] = text
+                if cache is not None:
+                    cache.put(hashes[index], text)
+        
+        return texts
+    
+    @property
+    def ocr_pipeline(self) -> 'OcrPipeline':
+        """Етап OCR з власним пулом процесів (створюється при першому зображенні)"""
+        if self._ocr_pipeline is None:
+            from ocr_pipeline import OcrPipeline
+            self._ocr_pipeline = OcrPipeline(workers=self.ocr_workers, slots=self.ocr_slots)
+        return self._ocr_pipeline
+    
+    @property
+    def ocr_cache(self) -> Optional[OcrCache]:
+        """Кеш OCR; None, якщо вимкнений або недоступний"""
+        if self.use_ocr_cache and self._ocr_cache is None:
+            try:
+                self._ocr_cache = OcrCache(f"{self.ocr_pipeline.settings()};preprocess={PREPROCESS_VERSION}")
+            except Exception:
+                # Недоступний кеш не повинен зупиняти розпізнавання
+                self.use_ocr_cache = False
+        return self._ocr_cache
+    
+    def _preprocess_image(self, image: 'Image.Image') -> 'Image.Image':
         """Попередня обробка зображення для покращення якості OCR"""
+        from PIL import ImageEnhance, ImageFilter
+        
         # Конвертуємо в сірий
         if image.mode != 'L':
             image = image.convert('L')
@@ -155,26 +329,30 @@ class UniversalOrderParser:
     def parse_document(self, file_path: str) -> Dict:
         """Універсальний метод парсингу документів"""
         try:
-            # Читаємо файл
-            text = self.read_file(file_path)
-            text = self.clean_text(text)
+            # Читаємо файл і один раз нормалізуємо текст
+            raw_text, encoding = self.read_document(file_path)
+            context = DocumentContext.from_raw(raw_text, self.keywords)
+            text = context.text
             
             # Використовуємо розширений парсер для детального аналізу
-            advanced_data = self.advanced_parser.parse_advanced_order(text)
+            advanced_data = self.advanced_parser.parse_advanced_order(text, context)
             
             # Формуємо результат
             result = {
                 'file_name': os.path.basename(file_path),
+                'file_path': os.path.abspath(file_path),
                 'file_type': os.path.splitext(file_path)[1].lower(),
                 'file_size': os.path.getsize(file_path),
-                'type': self.detect_order_type(text),
-                'number': self.extract_order_number(text),
-                'date': self.extract_date(text),
+                'type': context.order_type,
+                'number': context.order_number,
+                'date': context.date,
                 'personnel': [],
                 'raw_text': text[:1000],  # Зберігаємо більше тексту для аналізу
                 'advanced_data': advanced_data,
                 'processing_time': datetime.now().isoformat()
             }
+            if encoding is not None:
+                result['encoding'] = encoding
             
             # Конвертуємо розширені дані про персонал
             if 'personnel_changes' in advanced_data:
@@ -193,6 +371,7 @@ class UniversalOrderParser:
         except Exception as e:
             return {
                 'file_name': os.path.basename(file_path),
+                'file_path': os.path.abspath(file_path),
                 'error': str(e),
                 'personnel': [],
                 'advanced_data': {},
@@ -201,53 +380,49 @@ class UniversalOrderParser:
     
     def clean_text(self, text: str) -> str:
         """Очищення тексту від зайвих пробілів та артефактів"""
-        # Заміна multiple пробілів на один
-        text = re.sub(r'\s+', ' ', text)
-        # Видалення спеціальних символів, що можуть виникнути при OCR
-        text = re.sub(r'[^\w\sА-ЯІЇЄа-яіїєґҐ.,;:!?()\-—№\'"]', ' ', text)
-        return text.strip()
+        return clean_text(text)
     
     def detect_order_type(self, text: str) -> str:
         """Визначення типу наказу"""
-        text_lower = text.lower()
-        for order_type, keywords in self.patterns['order_types'].items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    return order_type
-        return 'невідомо'
+        return self.keywords.first(text, 'order_type') or 'невідомо'
     
     def extract_order_number(self, text: str) -> Optional[str]:
         """Витягнення номера наказу"""
-        patterns = [
-            r'№\s*(\d+)',
-            r'Наказ.*?№\s*(\d+)',
-            r'НАКАЗ.*?№\s*(\d+)'
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1)
-        return None
+        return find_order_number(text)
     
     def extract_date(self, text: str) -> Optional[str]:
         """Витягнення дати"""
-        date_patterns = [
-            r'\b(\d{1,2}\.\d{1,2}\.\d{4})\b',
-            r'\b(\d{1,2}\s+[сС]ічня|[лЛ]ютого|[бБ]ерезня|[кК]вітня|[тТ]равня|[чЧ]ервня|[лЛ]ипня|[сС]ерпня|[вВ]ересня|[жЖ]овтня|[лЛ]истопада|[гГ]рудня)\s+(\d{4})'
-        ]
-        for pattern in date_patterns:
-            match = re.search(pattern, text)
-            if match:
-                if len(match.groups()) == 1:
-                    return match.group(1)
-                else:
-                    return f"{match.group(1)} {match.group(2)}"
-        return None
+        return find_date(text)
 
 # Клас AdvancedOrderParser залишається таким самим, як у попередній версії
 class AdvancedOrderParser:
-    # ... (код з попередньої версії без змін)
-    def __init__(self):
+    # Пункт про зміни особового складу починається з ПІБ (три слова з великої літери)
+    _NAME_START_RE = re.compile(r'\s*[А-ЯІЇЄ][а-яіїє]+\s+[А-ЯІЇЄ][а-яіїє]+\s+[А-ЯІЇЄ][а-яіїє]+')
+    
+    # Пошук ПІБ у форматі "звання Прізвище Ім'я По-батькові"
+    _PERSON_NAME_RE = re.compile(r'([А-ЯІЇЄ][а-яіїє]+\s+[А-ЯІЇЄ][а-яіїє]+\s+[А-ЯІЇЄ][а-яіїє]+\s+[А-ЯІЇЄ][а-яіїє]+)')
+    
+    # Патерни для фінансових виплат
+    _PAYMENT_RES = [
+        re.compile(r'Виплачувати.*?(\d+).*?%', re.IGNORECASE),
+        re.compile(r'виплатити.*?(\d+).*?грн', re.IGNORECASE),
+        re.compile(r'надбавку.*?(\d+).*?%', re.IGNORECASE),
+        re.compile(r'премію.*?(\d+).*?%', re.IGNORECASE)
+    ]
+    
+    _DOCUMENT_RES = {
+        'access_termination': re.compile(r'Припинити доступ.*?таємницю', re.IGNORECASE),
+        'vacation': re.compile(r'відпустк[ауі].*?(\d+).*?діб', re.IGNORECASE),
+        'business_trip': re.compile(r'відрядженн[яю].*?(\d+).*?діб', re.IGNORECASE)
+    }
+    
+    _STRUCTURE_RES = [
+        re.compile(r'штат.*?№\s*(\d+[/\d]*)', re.IGNORECASE),
+        re.compile(r'військову частину.*?вважати.*?розформованою', re.IGNORECASE),
+        re.compile(r'ввести в дію штат', re.IGNORECASE)
+    ]
+    
+    def __init__(self, keywords: Optional[KeywordMatcher] = None):
         self.patterns = {
             'order_types': {
                 'personnel': 'по особовому складу',
@@ -273,14 +448,23 @@ class AdvancedOrderParser:
                 'солдат запасу'
             ]
         }
+        # Без спільного автомата (з patterns.json) будуємо власний з вбудованих шаблонів
+        self.keywords = keywords or KeywordMatcher.from_patterns(self.patterns)
     
-    def parse_advanced_order(self, text: str) -> Dict:
-        """Розширений парсинг наказу"""
+    def parse_advanced_order(self, text: str, context: Optional[DocumentContext] = None) -> Dict:
+        """Розширений парсинг наказу.
+
+        Реквізити наказу беруться зі спільного контексту документа; без нього
+        контекст створюється для вже очищеного тексту.
+        """
+        if context is None:
+            context = DocumentContext(text, self.keywords)
+        
         result = {
-            'order_type': self.detect_order_type(text),
-            'order_number': self.extract_order_number(text),
-            'order_date': self.extract_date(text),
-            'military_unit': self.extract_military_unit(text),
+            'order_type': context.order_type,
+            'order_number': context.order_number,
+            'order_date': context.date,
+            'military_unit': context.military_unit,
             'personnel_changes': [],
             'financial_operations': [],
             'document_operations': [],
@@ -289,57 +473,67 @@ class AdvancedOrderParser:
         }
         
         # Спеціальна обробка для витягів з наказів
-        if 'В И Т Я Г І З Н А К А З У' in text or 'ВИТЯГ ІЗ НАКАЗУ' in text:
+        if context.is_extract:
             result['is_extract'] = True
-            result['order_type'] = 'service'
         
-        # Аналіз різних типів пунктів
-        result['personnel_changes'] = self.extract_personnel_changes(text)
-        result['financial_operations'] = self.extract_financial_operations(text)
-        result['document_operations'] = self.extract_document_operations(text)
-        result['structural_changes'] = self.extract_structural_changes(text)
+        # Аналіз різних типів пунктів (текст розбивається на пункти один раз)
+        spans = context.segments
+        if context.is_extract:
+            result['personnel_changes'] = self.extract_extract_personnel(text, spans)
+        else:
+            result['personnel_changes'] = self.extract_personnel_changes(text, spans)
+        result['financial_operations'] = self.extract_financial_operations(text, spans)
+        result['document_operations'] = self.extract_document_operations(text, spans)
+        result['structural_changes'] = self.extract_structural_changes(text, spans)
         result['additional_info'] = self.extract_additional_info(text)
         
         return result
     
-    def extract_personnel_changes(self, text: str) -> List[Dict]:
+    def extract_personnel_changes(self, text: str, spans: Optional[List[PointSpan]] = None) -> List[Dict]:
         """Витягнення змін особового складу"""
         changes = []
         
         # Спеціальна обробка для документів типу витягу
-        if 'В И Т Я Г І З Н А К А З У' in text:
+        if spans is None and 'В И Т Я Г І З Н А К А З У' in text:
             return self.extract_extract_personnel(text)
         
-        # Знаходження призначень за номерованими пунктами
-        appointments = re.findall(r'(\d+\.)\s*([А-ЯІЇЄ][а-яіїє]+\s+[А-ЯІЇЄ][а-яіїє]+\s+[А-ЯІЇЄ][а-яіїє]+.*?)(?=\d+\.|Підстава|$)', text, re.DOTALL)
+        if spans is None:
+            spans = segment_points(text, ORDER_STOP_WORDS)
         
-        for num, content in appointments:
+        # Призначення — пронумеровані пункти, що починаються з ПІБ
+        for span in numbered_points(spans):
+            if not self._NAME_START_RE.match(text, span.start):
+                continue
+            
+            content = span.content(text)
             change = {
                 'type': self.detect_person_action(content),
-                'point_number': num.strip('.'),
+                'point_number': span.number,
                 'personnel_data': self.extract_personnel_from_text(content),
-                'content': content.strip()
+                'content': content
             }
             changes.append(change)
         
         return changes
     
-    def extract_extract_personnel(self, text: str) -> List[Dict]:
+    def extract_extract_personnel(self, text: str, spans: Optional[List[PointSpan]] = None) -> List[Dict]:
         """Спеціальна обробка для витягів з наказів"""
         changes = []
         
-        # Шукаємо пункти у витягах (формат "2. Текст пункту")
-        points = re.findall(r'(\d+\.)\s*(.*?)(?=\d+\.|Командир|Підстава|$)', text, re.DOTALL)
+        # Пункти у витягах (формат "2. Текст пункту") завершуються підписом командира
+        if spans is None:
+            spans = segment_points(text, EXTRACT_STOP_WORDS)
         
-        for num, content in points:
-            if not content.strip():
+        for span in numbered_points(spans):
+            content = span.content(text)
+            if not content:
                 continue
                 
             change = {
                 'type': self.detect_person_action(content),
-                'point_number': num.strip('.'),
+                'point_number': span.number,
                 'personnel_data': self.extract_personnel_from_text(content),
-                'content': content.strip()
+                'content': content
             }
             
             # Додаткова обробка для призову на службу
@@ -392,36 +586,28 @@ class AdvancedOrderParser:
         """Витягнення даних про персонал з тексту"""
         personnel = []
         
-        # Пошук ПІБ у форматі "звання Прізвище Ім'я По-батькові"
-        name_pattern = r'([А-ЯІЇЄ][а-яіїє]+\s+[А-ЯІЇЄ][а-яіїє]+\s+[А-ЯІЇЄ][а-яіїє]+\s+[А-ЯІЇЄ][а-яіїє]+)'
-        matches = re.findall(name_pattern, text)
+        # Індекс посад будується один раз на фрагмент, дія однакова для всього фрагмента
+        positions = PositionIndex(text)
+        action = self.detect_person_action(text)
         
-        for match in matches:
+        for match in self._PERSON_NAME_RE.finditer(text):
+            full_name = match.group(1)
             person_data = {
-                'full_name': match,
-                'rank': self.extract_rank_from_text(match),
-                'position': self.extract_position_from_context(text, match),
-                'action': self.detect_person_action(text)
+                'full_name': full_name,
+                'rank': self.extract_rank_from_text(full_name),
+                'position': positions.position_after(match.end()),
+                'action': action
             }
             personnel.append(person_data)
         
         return personnel
     
-    def extract_financial_operations(self, text: str) -> List[Dict]:
+    def extract_financial_operations(self, text: str, spans: Optional[List[PointSpan]] = None) -> List[Dict]:
         """Витягнення фінансових операцій"""
         operations = []
         
-        # Патерни для фінансових виплат
-        payment_patterns = [
-            r'Виплачувати.*?(\d+).*?%',
-            r'виплатити.*?(\d+).*?грн',
-            r'надбавку.*?(\d+).*?%',
-            r'премію.*?(\d+).*?%'
-        ]
-        
-        for pattern in payment_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in self._PAYMENT_RES:
+            for match in self._finditer_spans(pattern, text, spans):
                 operation = {
                     'type': 'фінансова_виплата',
                     'description': match.group(0),
@@ -431,19 +617,12 @@ class AdvancedOrderParser:
         
         return operations
     
-    def extract_document_operations(self, text: str) -> List[Dict]:
+    def extract_document_operations(self, text: str, spans: Optional[List[PointSpan]] = None) -> List[Dict]:
         """Витягнення операцій з документами"""
         operations = []
         
-        doc_patterns = {
-            'access_termination': r'Припинити доступ.*?таємницю',
-            'vacation': r'відпустк[ауі].*?(\d+).*?діб',
-            'business_trip': r'відрядженн[яю].*?(\d+).*?діб'
-        }
-        
-        for op_type, pattern in doc_patterns.items():
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for op_type, pattern in self._DOCUMENT_RES.items():
+            for match in self._finditer_spans(pattern, text, spans):
                 operation = {
                     'type': op_type,
                     'description': match.group(0),
@@ -453,19 +632,12 @@ class AdvancedOrderParser:
         
         return operations
     
-    def extract_structural_changes(self, text: str) -> List[Dict]:
+    def extract_structural_changes(self, text: str, spans: Optional[List[PointSpan]] = None) -> List[Dict]:
         """Витягнення структурних змін"""
         changes = []
         
-        structure_patterns = [
-            r'штат.*?№\s*(\d+[/\d]*)',
-            r'військову частину.*?вважати.*?розформованою',
-            r'ввести в дію штат'
-        ]
-        
-        for pattern in structure_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in self._STRUCTURE_RES:
+            for match in self._finditer_spans(pattern, text, spans):
                 change = {
                     'type': 'структурна_зміна',
                     'description': match.group(0),
@@ -475,6 +647,13 @@ class AdvancedOrderParser:
         
         return changes
     
+    def _finditer_spans(self, pattern, text: str, spans: Optional[List[PointSpan]]):
+        """Пошук у межах кожного фрагмента: ліниві «.*?» не виходять за межі пункту"""
+        if spans is None:
+            spans = segment_points(text, ORDER_STOP_WORDS)
+        for span in spans:
+            yield from pattern.finditer(text, span.start, span.end)
+    
     def extract_additional_info(self, text: str) -> Dict:
         """Витягнення додаткової інформації"""
         info = {}
@@ -507,43 +686,25 @@ class AdvancedOrderParser:
         return info
     
     def detect_order_type(self, text: str) -> str:
-        for order_type, pattern in self.patterns['order_types'].items():
-            if re.search(pattern, text, re.IGNORECASE):
-                return order_type
-        return 'невідомо'
+        return self.keywords.first(text, 'order_type') or 'невідомо'
     
     def extract_order_number(self, text: str) -> Optional[str]:
-        patterns = [r'№\s*(\d+)', r'Наказ.*?№\s*(\d+)']
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if match:
-                return match.group(1)
-        return None
+        return find_order_number(text)
     
     def extract_date(self, text: str) -> Optional[str]:
-        date_pattern = r'\d{1,2}\.\d{1,2}\.\d{4}'
-        match = re.search(date_pattern, text)
-        return match.group(0) if match else None
+        return find_date(text)
     
     def extract_military_unit(self, text: str) -> Optional[str]:
-        unit_pattern = r'військової частини\s*([А-Я]\d+)'
-        match = re.search(unit_pattern, text, re.IGNORECASE)
-        return match.group(1) if match else None
+        return DocumentContext(text, self.keywords).military_unit
     
     def extract_rank_from_text(self, text: str) -> Optional[str]:
-        for rank in self.patterns['ranks']:
-            if rank in text.lower():
-                return rank
-        return None
+        return self.keywords.first(text, 'rank')
     
     def extract_position_from_context(self, text: str, name: str) -> Optional[str]:
-        position_pattern = rf'{re.escape(name)}.*?на посаду\s*([^\.]+)'
-        match = re.search(position_pattern, text, re.IGNORECASE)
-        return match.group(1).strip() if match else None
+        offset = text.lower().find(name.lower())
+        if offset < 0:
+            return None
+        return PositionIndex(text).position_after(offset + len(name))
     
     def detect_person_action(self, text: str) -> str:
-        for action, keywords in self.patterns['actions'].items():
-            for keyword in keywords:
-                if keyword in text.lower():
-                    return action
-        return 'інша дія'
\ No newline at end of file
+        return self.keywords.first(text, 'action') or 'інша дія'
\ No newline at end of file
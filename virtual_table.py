@@ -0,0 +1,269 @@
+import bisect
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Фіксована висота рядка: за нею рахується кількість видимих рядків
+ROW_HEIGHT = 22
+HEADING_HEIGHT = 26
+
+
+def _sort_key(value):
+    """Числа сортуються як числа і стоять перед рядками"""
+    if isinstance(value, (int, float)):
+        return (0, value, '')
+    return (1, 0, str(value).lower())
+
+
+class VirtualTable(ttk.Frame):
+    """Таблиця результатів, що створює рядки лише для видимої частини даних.
+
+    Treeview містить стільки елементів, скільки рядків вміщує вікно; при
+    прокрутці змінюються лише їх значення, які читаються з джерела за
+    індексом. Сортування — окремий впорядкований список ключів сортування,
+    сам список записів не змінюється. Повне сортування виконується лише при
+    виборі колонки; записи, що надходять пізніше (upsert_row/remove_row),
+    вставляються у відсортований список бінарним пошуком, а зміна напрямку
+    лише читає його з іншого кінця. Виділення запам'ятовується за ключем
+    запису (повним шляхом файлу), тож воно не губиться при вставках,
+    сортуванні та прокрутці.
+    """
+
+    def __init__(self, master, columns: Sequence[Tuple[str, int]],
+                 row_values: Callable[[Dict], tuple],
+                 row_key: Callable[[Dict], str] = lambda record: record['file_path']):
+        super().__init__(master)
+        self.columns = [name for name, _ in columns]
+        self.row_values = row_values
+        self.row_key = row_key
+        self.records: Sequence[Dict] = []
+
+        # Відсортовані (ключ сортування, ключ запису) та запис за ключем запису
+        self._sorted: List[Tuple[tuple, str]] = []
+        self._sort_entries: Dict[str, Tuple[tuple, Dict]] = {}
+        self._sort_column: Optional[int] = None
+        self._sort_descending = False
+        self._offset = 0
+        self._visible_rows = 1
+        self._pool: List[str] = []
+        self._pool_keys: List[str] = []
+        self._selected_key: Optional[str] = None
+        self._redraw_pending = False
+
+        style = ttk.Style()
+        style.configure('Virtual.Treeview', rowheight=ROW_HEIGHT)
+
+        self.tree = ttk.Treeview(self, columns=self.columns, show='headings',
+                                 selectmode='browse', style='Virtual.Treeview')
+        for index, (name, width) in enumerate(columns):
+            self.tree.heading(name, text=name, command=lambda column=index: self.sort_by(column))
+            self.tree.column(name, width=width)
+
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.tree.bind('<Configure>', self._on_resize)
+        self.tree.bind('<<TreeviewSelect>>', self._on_select)
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.tree.bind('<Button-4>', lambda event: self.scroll_rows(-3))
+        self.tree.bind('<Button-5>', lambda event: self.scroll_rows(3))
+        for key, step in (('<Up>', -1), ('<Down>', 1), ('<Prior>', 'page-up'), ('<Next>', 'page-down'),
+                          ('<Home>', 'home'), ('<End>', 'end')):
+            self.tree.bind(key, lambda event, step=step: self._move_selection(step))
+
+    def set_source(self, records: Sequence[Dict]):
+        """Джерело даних: список записів, що змінюється на місці (ResultsStore.records)"""
+        self.records = records
+        self._resort()
+        self.refresh()
+
+    def upsert_row(self, record: Dict):
+        """Запис додано до джерела або замінено в ньому"""
+        if self._sort_column is not None:
+            self._unsort(self.row_key(record))
+            self._insort(record)
+        self.refresh()
+
+    def remove_row(self, record: Dict):
+        """Запис видалено з джерела"""
+        if self._sort_column is not None:
+            self._unsort(self.row_key(record))
+        self.refresh()
+
+    def refresh(self):
+        """Перемалювання відкладається до простою: кілька змін — одне перемалювання"""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._redraw)
+
+    def reset(self):
+        """Нове джерело даних з початку: прокрутка вгору, без виділення"""
+        self._offset = 0
+        self._selected_key = None
+        self._resort()
+        self.refresh()
+
+    def bind_rows(self, sequence: str, callback):
+        self.tree.bind(sequence, callback)
+
+    def selected_key(self) -> Optional[str]:
+        """Ключ виділеного запису (повний шлях файлу)"""
+        return self._selected_key
+
+    # --- Сортування --------------------------------------------------------
+
+    def sort_by(self, column: int):
+        """Сортування за колонкою; повторне клацання змінює напрямок"""
+        if self._sort_column == column:
+            self._sort_descending = not self._sort_descending
+        else:
+            self._sort_column = column
+            self._sort_descending = False
+            self._resort()
+        for index, name in enumerate(self.columns):
+            arrow = ''
+            if index == self._sort_column:
+                arrow = ' ▼' if self._sort_descending else ' ▲'
+            self.tree.heading(name, text=name + arrow)
+        self._offset = 0
+        self.refresh()
+
+    def _sort_value(self, record: Dict) -> tuple:
+        return _sort_key(self.row_values(record)[self._sort_column])
+
+    def _resort(self):
+        """Повне сортування джерела за поточною колонкою"""
+        self._sorted = []
+        self._sort_entries = {}
+        if self._sort_column is None:
+            return
+        for record in self.records:
+            key = self.row_key(record)
+            self._sort_entries[key] = (self._sort_value(record), record)
+        self._sorted = sorted((value, key) for key, (value, _) in self._sort_entries.items())
+
+    def _insort(self, record: Dict):
+        key = self.row_key(record)
+        value = self._sort_value(record)
+        self._sort_entries[key] = (value, record)
+        bisect.insort(self._sorted, (value, key))
+
+    def _unsort(self, key: str):
+        entry = self._sort_entries.pop(key, None)
+        if entry is not None:
+            position = bisect.bisect_left(self._sorted, (entry[0], key))
+            del self._sorted[position]
+
+    def _row_count(self) -> int:
+        return len(self.records)
+
+    def _record_at(self, position: int) -> Dict:
+        """Запис на позиції position у порядку показу"""
+        if self._sort_column is None:
+            return self.records[position]
+        index = len(self._sorted) - 1 - position if self._sort_descending else position
+        return self._sort_entries[self._sorted[index][1]][1]
+
+    # --- Прокрутка ---------------------------------------------------------
+
+    def yview(self, *args):
+        """Команда смуги прокрутки: 'moveto' частка або 'scroll' n units|pages"""
+        total = self._row_count()
+        if args[0] == 'moveto':
+            self._scroll_to(round(float(args[1]) * total))
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            if args[2] == 'pages':
+                step *= max(self._visible_rows - 1, 1)
+            self._scroll_to(self._offset + step)
+
+    def scroll_rows(self, rows: int):
+        self._scroll_to(self._offset + rows)
+
+    def _scroll_to(self, offset: int):
+        offset = max(0, min(offset, self._row_count() - self._visible_rows))
+        if offset != self._offset:
+            self._offset = offset
+            self._redraw()
+
+    def _on_mousewheel(self, event):
+        self.scroll_rows(-3 if event.delta > 0 else 3)
+        return 'break'
+
+    def _on_resize(self, event):
+        rows = max(1, (event.height - HEADING_HEIGHT) // ROW_HEIGHT)
+        if rows != self._visible_rows:
+            self._visible_rows = rows
+            self._redraw()
+
+    # --- Виділення ---------------------------------------------------------
+
+    def _on_select(self, event):
+        selection = self.tree.selection()
+        if selection and selection[0] in self._pool:
+            self._selected_key = self._pool_keys[self._pool.index(selection[0])]
+
+    def _move_selection(self, step) -> str:
+        total = self._row_count()
+        if not total:
+            return 'break'
+        if self._selected_key in self._pool_keys:
+            current = self._offset + self._pool_keys.index(self._selected_key)
+        else:
+            current = self._offset - 1
+
+        if step == 'home':
+            target = 0
+        elif step == 'end':
+            target = total - 1
+        elif step == 'page-up':
+            target = current - self._visible_rows
+        elif step == 'page-down':
+            target = current + self._visible_rows
+        else:
+            target = current + step
+        target = max(0, min(target, total - 1))
+
+        self._selected_key = self.row_key(self._record_at(target))
+        if target < self._offset:
+            self._offset = target
+        elif target >= self._offset + self._visible_rows:
+            self._offset = target - self._visible_rows + 1
+        self._redraw()
+        return 'break'
+
+    # --- Малювання ---------------------------------------------------------
+
+    def _redraw(self):
+        """Заповнення видимих рядків значеннями з джерела"""
+        self._redraw_pending = False
+        total = self._row_count()
+        self._offset = max(0, min(self._offset, total - self._visible_rows))
+        count = min(self._visible_rows, total - self._offset)
+
+        while len(self._pool) < count:
+            self._pool.append(self.tree.insert('', 'end'))
+        while len(self._pool) > count:
+            self.tree.delete(self._pool.pop())
+
+        self._pool_keys = []
+        selected_item = None
+        for position, item in enumerate(self._pool, self._offset):
+            record = self._record_at(position)
+            key = self.row_key(record)
+            self._pool_keys.append(key)
+            self.tree.item(item, values=self.row_values(record))
+            if key == self._selected_key:
+                selected_item = item
+
+        if selected_item is not None:
+            self.tree.selection_set(selected_item)
+            self.tree.focus(selected_item)
+        elif self.tree.selection():
+            self.tree.selection_remove(*self.tree.selection())
+
+        if total:
+            self.scrollbar.set(self._offset / total, (self._offset + count) / total)
+        else:
+            self.scrollbar.set(0, 1)